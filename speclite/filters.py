@@ -178,6 +178,12 @@ Note that the eliminating flux units (which are always optional) from your
 input spectra will only result in about a 10% speedup, so units are generally
 recommended.
 
+Convolutions of single-precision (``np.float32``) flux arrays are evaluated
+in single precision, which halves the memory traffic for large arrays of
+spectra. The resulting relative errors of about :math:`10^{-6}` are well below
+the accuracy of the tabulated filter responses, and magnitudes are always
+calculated in double precision from the resulting maggies.
+
 Attributes
 ----------
 filter_group_names : list
@@ -192,19 +198,33 @@ from __future__ import print_function, division
 
 import os
 import os.path
-import glob
+import imp
 import re
+import threading
+import functools
+import weakref
 import collections
+import hashlib
+import json
+import tempfile
+import multiprocessing.pool
 
 import numpy as np
 
-import scipy.interpolate
 import scipy.integrate
 
+import astropy.config.paths
 import astropy.table
+import astropy.table.meta
 import astropy.units
 import astropy.utils.data
 
+try:
+    # The pandas C parser is used to read filter files when available.
+    import pandas
+except ImportError:
+    pandas = None
+
 
 filter_group_names = [
     'sdss2010', 'decam2014', 'wise2010', 'bessell']
@@ -226,9 +246,125 @@ _hc_constant = (astropy.constants.h * astropy.constants.c).to(
 
 _photon_weighted_unit = default_wavelength_unit**2 / _hc_constant.unit
 
+
+def _fused_trapz(y, x, axis=-1):
+    """Integrate tabulated values using the trapezoid rule.
+
+    Gives the same result as :func:`scipy.integrate.trapz` for a 1D array of
+    x values, but contracts the sum of adjacent y values directly with the
+    half interval widths, without materializing their product.
+    """
+    y = np.asarray(y)
+    y = np.rollaxis(y, axis, y.ndim)
+    # Calculate the interval widths in double precision, but then use the
+    # working precision of y, which might be single precision.
+    half_dx = (0.5 * np.diff(x)).astype(np.result_type(y.dtype, np.float32))
+    return np.einsum('...i,i->...', y[..., 1:] + y[..., :-1], half_dx)
+
+
+def _trapz_weights(x):
+    """Calculate the trapezoid rule weights for a grid of x values.
+
+    The weights are defined so that ``np.dot(y, _trapz_weights(x))`` equals
+    the trapezoid rule integral of y(x).
+    """
+    half_dx = 0.5 * np.diff(x)
+    weights = np.empty(len(x))
+    weights[0] = half_dx[0]
+    weights[-1] = half_dx[-1]
+    weights[1:-1] = half_dx[:-1] + half_dx[1:]
+    return weights
+
+
+def _uniform_spacing(x):
+    """Return the constant spacing of a grid of x values, or None.
+
+    A grid is considered uniform when its interval widths all agree to within
+    a small multiple of the double precision round-off in x.
+    """
+    dx = np.diff(x)
+    if np.ptp(dx) <= 8 * np.finfo(float).eps * np.max(np.abs(x[[0, -1]])):
+        return float(x[-1] - x[0]) / (len(x) - 1)
+    return None
+
+
+def _uniform_trapz(y, dx, axis=-1):
+    """Integrate tabulated values on a uniform grid using the trapezoid rule.
+
+    Uses the closed form for a constant interval width dx, which avoids any
+    array of interval widths.
+    """
+    y = np.asarray(y)
+    y = np.rollaxis(y, axis, y.ndim)
+    return (0.5 * (y[..., 0] + y[..., -1]) + y[..., 1:-1].sum(axis=-1)) * dx
+
+
+def _linear_interpolation_weights(x, xp):
+    """Calculate the weights for linear interpolation from xp onto x.
+
+    Returns a tuple (idx, w) such that the linear interpolation of any values
+    fp tabulated on the grid xp is ``(1 - w) * fp[idx] + w * fp[idx + 1]``.
+    The same weights can then be reused for any number of fp arrays on the
+    same pair of grids.  Values of x outside of xp are assigned the nearest
+    end value of fp.
+    """
+    idx = np.clip(np.searchsorted(xp, x) - 1, 0, len(xp) - 2)
+    w = np.clip((x - xp[idx]) / (xp[idx + 1] - xp[idx]), 0., 1.)
+    return idx, w
+
+
+def _unit_scale(unit, target):
+    """Return the factor that converts values in unit to target units.
+
+    Factors are cached since the same pair of units is usually converted for
+    every convolution.  Raises UnitConversionError for incompatible units.
+    """
+    key = (unit, target)
+    try:
+        return _unit_scale_cache[key]
+    except KeyError:
+        pass
+    scale = unit.to(target)
+    if len(_unit_scale_cache) >= _max_unit_scale_cache_size:
+        _unit_scale_cache.clear()
+    _unit_scale_cache[key] = scale
+    return scale
+
+
+def _broadcast_shape(ndim, axis, length):
+    """Return the shape that broadcasts a 1D array of length along axis.
+
+    Shapes are cached since the same few combinations of arguments are needed
+    for every convolution.
+    """
+    key = (ndim, axis, length)
+    try:
+        return _broadcast_shape_cache[key]
+    except KeyError:
+        pass
+    shape = [1] * ndim
+    shape[axis] = length
+    shape = tuple(shape)
+    if len(_broadcast_shape_cache) >= _max_broadcast_shape_cache_size:
+        _broadcast_shape_cache.clear()
+    _broadcast_shape_cache[key] = shape
+    return shape
+
+
+def _broadcast_along(array, ndim, axis):
+    """Prepare a 1D array to broadcast along one axis of an ndim array.
+
+    The axis must be non-negative.  No reshaping is needed when the axis is
+    the last one, in which case the input array is returned.
+    """
+    if axis == ndim - 1:
+        return array
+    return array.reshape(_broadcast_shape(ndim, axis, len(array)))
+
+
 # Map names to integration methods allowed by the convolution methods below.
 _filter_integration_methods = dict(
-    trapz= scipy.integrate.trapz,
+    trapz= _fused_trapz,
     simps= scipy.integrate.simps)
 
 # Group and band names must be valid python identifiers. Although a leading
@@ -243,6 +379,52 @@ _group_wildcard = re.compile('^([a-zA-Z_][a-zA-Z0-9_]*)-\*\Z')
 # Dictionary of cached FilterResponse objects.
 _filter_cache = {}
 
+# Serializes the loading of each filter file by different threads, using a
+# fixed pool of locks that each name is assigned to by its hash.
+_filter_load_locks = tuple(threading.Lock() for i in range(16))
+
+# Minimum number of filters that load_filters loads with a pool of threads,
+# and the maximum number of threads to use.
+_min_thread_pool_loads = 4
+_max_thread_pool_size = 8
+
+# Dictionary of directory listings used by _list_filter_files, keyed by path.
+_filter_listing_cache = {}
+
+# Dictionaries of standard filter file names, keyed by canonical name, and of
+# the canonical names in each standard group, keyed by group name, that are
+# filled by _scan_standard_filters.
+_standard_filter_paths = {}
+_standard_filter_groups = {}
+
+# Dictionary of the canonical names in each standard group, ordered by
+# increasing effective wavelength, as used by load_filters.
+_sorted_group_cache = {}
+
+# Name of the index of effective wavelengths in a directory of filter files,
+# and a dictionary of the indices read by _load_filter_index, keyed by path.
+_filter_index_name = '_index.json'
+_filter_index_cache = {}
+
+# Dictionary of recently validated read-only wavelength arrays, keyed by id(),
+# with values (weak reference, converted array or None).  Its size is limited
+# to _max_grid_cache_size.
+_validated_cache = {}
+
+# Dictionary of unit conversion factors used by _unit_scale, and its maximum
+# size.
+_unit_scale_cache = {}
+_max_unit_scale_cache_size = 64
+
+# Dictionary of broadcast shapes used by _broadcast_shape, and its maximum
+# size.
+_broadcast_shape_cache = {}
+_max_broadcast_shape_cache_size = 256
+
+# Maximum number of wavelength grids for which each FilterResponse caches its
+# interpolated response values and prepared convolutions.
+_max_grid_cache_size = 16
+
 
 def ab_reference_flux(wavelength, magnitude=0.):
     """Calculate an AB reference spectrum with the specified magnitude.
@@ -281,19 +463,27 @@ def ab_reference_flux(wavelength, magnitude=0.):
     """
     magnitude = np.asarray(magnitude)
     try:
-        wavelength = wavelength.to(default_wavelength_unit)
+        wavelength = wavelength.to(default_wavelength_unit).value
     except (AttributeError, astropy.units.UnitConversionError):
         raise ValueError('Cannot evaluate flux for invalid wavelength.')
 
-    flux = 10 ** (-0.4 * magnitude) * _ab_constant / wavelength ** 2
-    return flux.to(default_flux_unit)
+    # Calculate with plain arrays and only apply units to the result.
+    flux = (10 ** (-0.4 * magnitude) * _ab_constant.value /
+            (wavelength * wavelength))
+    return flux * default_flux_unit
 
 
 def validate_wavelength_array(wavelength, min_length=0):
     """Validate a wavelength array for filter operations.
 
     This function will not perform any copying or allocation if the input
-    is already a numpy array or astropy Quantity.
+    is already a numpy array, or an astropy Quantity in
+    :attr:`default_wavelength_unit`.  The input array is never modified.
+
+    The result of validating a read-only numpy array or astropy Quantity,
+    whose values therefore cannot change, is remembered while the input
+    object exists, so that validating the same object again is fast.
+    Writeable inputs are validated every time.
 
     Parameters
     ----------
@@ -320,21 +510,73 @@ def validate_wavelength_array(wavelength, min_length=0):
         The wavelength array has units that are not convertible to
         :attr:`default_wavelength_unit`
     """
+    key = id(wavelength)
+    cached = _validated_cache.get(key)
+    if cached is not None and cached[0]() is wavelength and (
+            _is_read_only(wavelength)):
+        wavelength_no_units = cached[1]
+        if wavelength_no_units is None:
+            wavelength_no_units = np.asarray(wavelength)
+        if len(wavelength_no_units) < min_length:
+            raise ValueError('Minimum length is {0}.'.format(min_length))
+        return wavelength_no_units
+
     wavelength_no_units = np.asarray(wavelength)
-    try:
-        wavelength_no_units *= wavelength.unit.to(default_wavelength_unit)
-    except AttributeError:
-        # No units present, so assume default units.
-        pass
+    converted = None
+    # Assume default units when no units are present.
+    unit = getattr(wavelength, 'unit', None)
+    if unit is not None:
+        scale = unit.to(default_wavelength_unit)
+        # Only convert when necessary, and never in place since our input
+        # array belongs to the caller.
+        if scale != 1.:
+            wavelength_no_units = converted = wavelength_no_units * scale
     if len(wavelength_no_units.shape) != 1:
         raise ValueError('Wavelength array must be 1D.')
     if len(wavelength_no_units) < min_length:
         raise ValueError('Minimum length is {0}.'.format(min_length))
-    if not np.all(np.diff(wavelength_no_units) > 0):
+    # Compare adjacent values directly, which avoids the temporary array of
+    # differences.
+    if not np.all(wavelength_no_units[1:] > wavelength_no_units[:-1]):
         raise ValueError('Wavelength values must be strictly increasing.')
+
+    # Remember this result if the input values cannot change and it supports
+    # weak references.  The cache only holds a converted copy, or nothing when
+    # no conversion was needed, so that it never keeps the input alive.
+    if _is_read_only(wavelength):
+        # Bind the cache now since module globals might already be gone
+        # when this callback runs during interpreter shutdown.
+        def forget(ref, cache=_validated_cache):
+            if cache.get(key, (None,))[0] is ref:
+                del cache[key]
+        try:
+            ref = weakref.ref(wavelength, forget)
+        except TypeError:
+            pass
+        else:
+            if converted is not None:
+                converted.flags.writeable = False
+            if len(_validated_cache) >= _max_grid_cache_size:
+                _validated_cache.clear()
+            _validated_cache[key] = (ref, converted)
     return wavelength_no_units
 
 
+def _is_read_only(values):
+    """Test if the values of an array cannot be modified.
+
+    Returns True when the array, and any array whose memory it views, is
+    not writeable.  Returns False for any other input.
+    """
+    if not isinstance(values, np.ndarray):
+        return False
+    while isinstance(values, np.ndarray):
+        if values.flags.writeable:
+            return False
+        values = values.base
+    return True
+
+
 def tabulate_function_of_wavelength(function, wavelength, verbose=False):
     """Evaluate a function of wavelength.
 
@@ -352,6 +594,8 @@ def tabulate_function_of_wavelength(function, wavelength, verbose=False):
         evaluated.  Wavelengths must have valid units.
     verbose : bool
         Print details of the sequence of attempts used to call the function.
+        The calling convention that succeeds is remembered as an attribute
+        of the function, when possible, and tried first next time.
 
     Returns
     -------
@@ -363,138 +607,106 @@ def tabulate_function_of_wavelength(function, wavelength, verbose=False):
     except (AttributeError, astropy.units.UnitConversionError):
         raise ValueError('Cannot evaluate function for invalid wavelength.')
 
-    function_units = None
-    # Try broadcasting our wavelength array with its units.
-    if verbose:
-        print('Trying to broadcast with units.')
-    try:
-        function_values = function(wavelength)
+    # Use the calling convention that worked last time, if any.
+    mode = getattr(function, '_speclite_tabulate_mode', None)
+    if mode is not None:
         try:
-            function_units = function_values.unit
-            function_values = function_values.value
-        except AttributeError:
-            # Ok if the function does not return any units.
-            pass
-        return function_values, function_units
-    except Exception as e:
-        # Keep trying.
+            return _call_function(function, wavelength, mode)
+        except Exception as e:
+            # Inconsistent units found while iterating are fatal.
+            if mode.startswith('iterate') and isinstance(e, RuntimeError):
+                raise e
+            # Fall back to trying each mode in turn.
+            if verbose:
+                print('Previous mode {0} failed: {1}'.format(mode, e))
+
+    for mode, message in _tabulate_modes:
         if verbose:
-            print('Failed: {0}'.format(e))
-    # Try broadcasting our wavelength array without its units.
-    if verbose:
-        print('Trying to broadcast without units.')
-    try:
-        function_values = function(wavelength.value)
+            print(message)
         try:
-            function_units = function_values.unit
-            function_values = function_values.value
-        except AttributeError:
-            # Ok if the function does not return any units.
+            result = _call_function(function, wavelength, mode)
+        except Exception as e:
+            # Inconsistent units found while iterating are fatal.
+            if mode.startswith('iterate') and isinstance(e, RuntimeError):
+                raise e
+            # Keep trying.
+            if verbose:
+                print('Failed: {0}'.format(e))
+            continue
+        # Remember this calling convention for next time. This is not
+        # possible for some callables, such as bound methods.
+        try:
+            function._speclite_tabulate_mode = mode
+        except (AttributeError, TypeError):
             pass
-        return function_values, function_units
-    except Exception as e:
-        # Keep trying.
-        if verbose:
-            print('Failed: {0}'.format(e))
-    # Try looping over wavelengths and including units.
-    if verbose:
-        print('Trying to iterate with units.')
-    try:
-        function_values = []
-        for i, w in enumerate(wavelength.value):
-            value = function(w * default_wavelength_unit)
-            # Check that the function is consistent in the units it returns.
-            if i == 0:
-                # Remember the units of the first function value.
-                try:
-                    function_units = value.unit
-                    value = value.value
-                except AttributeError:
-                    # Ok if the function does not return any units.
-                    pass
-            elif function_units == None:
-                try:
-                    new_units = value.unit
-                    # Function has units now but did not earlier.
-                    raise RuntimeError(
-                        'Inconsistent function units: none, {0}.'
-                        .format(new_units))
-                except AttributeError:
-                    # Still no units, as expected.
-                    pass
-            else:
-                try:
-                    if function_units != value.unit:
-                        # Function units have changed.
-                        raise RuntimeError(
-                            'Inconsistent function units: {0}, {1}.'
-                            .format(function_units, value.unit))
-                except AttributeError:
-                    # Function had units before but does not now.
-                    raise RuntimeError(
-                        'Inconsistent function units: {0}, none.'
-                        .format(function_units))
-                value = value.value
-
-            function_values.append(value)
-        function_values = np.asarray(function_values)
-        return function_values, function_units
-    except RuntimeError as e:
-        raise e
-    except Exception as e:
-        # Keep trying.
-        if verbose:
-            print('Failed: {0}'.format(e))
-    # Try looping over wavelengths and not including units.
-    if verbose:
-        print('Trying to iterate without units.')
+        return result
+    # If we get here, none of the above strategies worked.
+    raise ValueError('Invalid function.')
+
+
+# Calling conventions that are tried, in order, to tabulate a function of
+# wavelength. The values are the messages printed in verbose mode.
+_tabulate_modes = (
+    ('broadcast_with_units', 'Trying to broadcast with units.'),
+    ('broadcast_without_units', 'Trying to broadcast without units.'),
+    ('iterate_with_units', 'Trying to iterate with units.'),
+    ('iterate_without_units', 'Trying to iterate without units.'),
+    )
+
+
+def _split_units(values):
+    """Split function values into a (values, units) tuple.
+    """
     try:
-        function_values = []
-        for i, w in enumerate(wavelength.value):
-            value = function(w)
-            # Check that the function is consistent in the units it returns.
-            if i == 0:
-                # Remember the units of the first function value.
-                try:
-                    function_units = value.unit
-                    value = value.value
-                except AttributeError:
-                    # Ok if the function does not return any units.
-                    pass
-            elif function_units == None:
-                try:
-                    new_units = value.unit
-                    # Function has units now but did not earlier.
-                    raise RuntimeError(
-                        'Inconsistent function units: none, {0}.'
-                        .format(new_units))
-                except AttributeError:
-                    # Still no units, as expected.
-                    pass
-            else:
-                try:
-                    if function_units != value.unit:
-                        # Function units have changed.
-                        raise RuntimeError(
-                            'Inconsistent function units: {0}, {1}.'
-                            .format(function_units, value.unit))
-                except AttributeError:
-                    # Function had units before but does not now.
-                    raise RuntimeError(
-                        'Inconsistent function units: {0}, none.'
-                        .format(function_units))
-                value = value.value
-
-            function_values.append(value)
-        function_values = np.asarray(function_values)
-        return function_values, function_units
-    except RuntimeError as e:
-        raise e
-    except Exception as e:
-        if verbose:
-            print('Failed: {0}'.format(e))
-        # If we get here, none of the above strategies worked.
-        raise ValueError('Invalid function.')
+        return values.value, values.unit
+    except AttributeError:
+        # Ok if the function does not return any units.
+        return values, None
+
+
+def _call_function(function, wavelength, mode):
+    """Tabulate a function using one of the :data:`_tabulate_modes`.
+
+    The wavelength must already be a Quantity in
+    :attr:`default_wavelength_unit`.  Raises RuntimeError if a function
+    that is called once per wavelength returns inconsistent units, or any
+    exception raised by the function itself.
+    """
+    if mode == 'broadcast_with_units':
+        return _split_units(function(wavelength))
+    elif mode == 'broadcast_without_units':
+        return _split_units(function(wavelength.value))
+
+    if mode == 'iterate_with_units':
+        values = [function(w * default_wavelength_unit)
+                  for w in wavelength.value]
+    else:
+        values = [function(w) for w in wavelength.value]
+    # Check that the function is consistent in the units it returns, using
+    # the units of the first function value as a reference.
+    function_units = getattr(values[0], 'unit', None)
+    for value in values[1:]:
+        value_units = getattr(value, 'unit', None)
+        if function_units is None:
+            if value_units is not None:
+                # Function has units now but did not earlier.
+                raise RuntimeError(
+                    'Inconsistent function units: none, {0}.'
+                    .format(value_units))
+        elif value_units is None:
+            # Function had units before but does not now.
+            raise RuntimeError(
+                'Inconsistent function units: {0}, none.'
+                .format(function_units))
+        elif value_units != function_units:
+            # Function units have changed.
+            raise RuntimeError(
+                'Inconsistent function units: {0}, {1}.'
+                .format(function_units, value_units))
+    if function_units is not None:
+        values = [value.value for value in values]
+    function_values = np.fromiter(values, dtype=float, count=len(values))
+    return function_values, function_units
 
 
 class FilterResponse(object):
@@ -598,10 +810,12 @@ class FilterResponse(object):
         trimming any extra leading or trailing zero response values.
     meta : dict
         Dictionary of metadata associated with this filter.
-    interpolator : :class:`scipy.interpolate.interp1d`
+    interpolator : callable
         Linear interpolator of our response function that returns zero for
-        all values outside our wavelength range.  Should normally be evaluated
-        through our :meth:`__call__` convenience method.
+        all values outside our wavelength range, implemented as a partial
+        application of :func:`numpy.interp`.  Should normally be evaluated
+        through our :meth:`__call__` convenience method, which also handles
+        units.
 
     Raises
     ------
@@ -611,9 +825,10 @@ class FilterResponse(object):
     """
     def __init__(self, wavelength, response, meta):
 
-        self._wavelength = validate_wavelength_array(wavelength, min_length=3)
-        # If response has units, np.asarray() makes a copy and drops the units.
-        self.response = np.asarray(response)
+        self._wavelength = np.ascontiguousarray(
+            validate_wavelength_array(wavelength, min_length=3), dtype=float)
+        # If response has units, this makes a copy and drops the units.
+        self.response = np.ascontiguousarray(response, dtype=float)
         if len(self._wavelength) != len(self.response):
             raise ValueError('Arrays must have same length.')
 
@@ -632,6 +847,24 @@ class FilterResponse(object):
             self._wavelength = self._wavelength[start: stop]
             self.response = self.response[start: stop]
 
+        # Store our wavelengths, responses and photon-weighted responses as
+        # the rows of a single contiguous block of unitless values, so that
+        # convolutions never need to handle astropy quantities internally.
+        self._table = np.empty((3, len(self._wavelength)))
+        self._table[0] = self._wavelength
+        self._table[1] = self.response
+        self._table[2] = self.response * self._wavelength / _hc_constant.value
+        self._wavelength, self.response, self._photon_response = self._table
+        # Select the response to use for each value of photon_weighted.
+        self._weighted_response = (self.response, self._photon_response)
+
+        # Remember our grid spacing if it is uniform, so that trapezoid rule
+        # integrals can use a scalar interval width.  Otherwise, precompute
+        # the trapezoid rule weights for our grid.
+        self._dx = _uniform_spacing(self._wavelength)
+        if self._dx is None:
+            self._trapz_weight = _trapz_weights(self._wavelength)
+
         # Check for the required metadata fields.
         try:
             self.meta = dict(meta)
@@ -649,22 +882,39 @@ class FilterResponse(object):
             except TypeError:
                 raise ValueError('Invalid value type for {0}.'.format(required))
 
-        # Create a linear interpolator of our response function that returns
-        # zero outside of our wavelength range.
-        self.interpolator = scipy.interpolate.interp1d(
-            self._wavelength, self.response, kind='linear',
-            copy=False, assume_sorted=True,
-            bounds_error=False, fill_value=0.)
-
-        # Calculate this filter's effective wavelength.
-        one = astropy.units.Quantity(1.)
-        numer = self.convolve_with_function(lambda wlen: wlen)
-        denom = self.convolve_with_function(lambda wlen: one)
-        self.effective_wavelength = numer / denom
-
-        # Calculate this filter's zeropoint in the AB system.
-        self.ab_zeropoint = self.convolve_with_function(
-            ab_reference_flux, units=default_flux_unit)
+        # Bind our tabulated response to a linear interpolator, which is
+        # cheap since no copies or tables are created.
+        self.interpolator = functools.partial(
+            np.interp, xp=self._wavelength, fp=self.response,
+            left=0., right=0.)
+
+        # Initialize our caches of responses interpolated onto input grids,
+        # and of convolutions prepared for input grids.
+        self._grid_cache = {}
+        self._convolution_cache = {}
+
+        # Initialize our cache of convolutions with functions, which is only
+        # used on request.
+        self._function_cache = weakref.WeakKeyDictionary()
+
+        # Calculate this filter's effective wavelength as the ratio of the
+        # first two moments of its photon-weighted response.  This is
+        # equivalent to convolving with the functions wlen and one, but
+        # uses our tabulated values directly instead of calling functions.
+        moment0 = self._integrate(self._photon_response, 'trapz')
+        moment1 = self._integrate(
+            self._photon_response * self._wavelength, 'trapz')
+        self.effective_wavelength = (
+            moment1 / moment0) * default_wavelength_unit
+
+        # Calculate this filter's zeropoint in the AB system.  This is
+        # equivalent to convolving with ab_reference_flux, but uses our
+        # tabulated values directly instead of calling a function.
+        ab_flux = _ab_constant.value / (self._wavelength * self._wavelength)
+        self.ab_zeropoint = self._integrate(
+            self._integrand(ab_flux, photon_weighted=True),
+            'trapz') * (default_flux_unit * _photon_weighted_unit)
+        self._ab_zero_value = float(self.ab_zeropoint.value)
 
         # Remember this object in our cache so that load_filter can find it.
         # In case this object is already in our cache, overwrite it now.
@@ -701,10 +951,90 @@ class FilterResponse(object):
         except AttributeError:
             # No units present, so assume the default units.
             pass
-        response = self.interpolator(wavelength)
-        # If the input was scalar, return a scalar.
-        if response.shape == ():
-            response = np.asscalar(response)
+        if np.ndim(wavelength) == 0:
+            # Interpolate a scalar input directly and return a python float.
+            wavelength = float(wavelength)
+            wlen, resp = self._wavelength, self.response
+            i = int(np.searchsorted(wlen, wavelength))
+            if i <= 0 or i >= len(wlen):
+                return 0.
+            t = (wavelength - wlen[i - 1]) / (wlen[i] - wlen[i - 1])
+            return float(resp[i - 1] + t * (resp[i] - resp[i - 1]))
+        # Linearly interpolate our response, which is zero outside of our
+        # wavelength range.
+        return np.interp(
+            wavelength, self._wavelength, self.response, left=0., right=0.)
+
+
+    def _integrand(self, values, photon_weighted):
+        """Build a convolution integrand on our wavelength grid.
+
+        The photon weights are already folded into our precomputed
+        photon-weighted response, so either case only needs a single
+        multiplication.
+
+        Parameters
+        ----------
+        values : numpy.ndarray or float
+            Function values without units tabulated on our wavelength grid.
+        photon_weighted : bool
+            Include photon-counting weights when True.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of integrand values on our wavelength grid.
+        """
+        return values * self._weighted_response[bool(photon_weighted)]
+
+
+    def _integrate(self, integrand, method):
+        """Integrate values tabulated on our wavelength grid.
+
+        Uses the closed-form trapezoid rule when our grid is uniform, or
+        else our precomputed trapezoid rule weights.
+        """
+        if method == 'trapz':
+            if self._dx is not None:
+                return _uniform_trapz(integrand, self._dx)
+            return np.dot(integrand, self._trapz_weight)
+        integrator = _filter_integration_methods[method]
+        return integrator(y=integrand, x=self._wavelength)
+
+
+    def _response_on_grid(self, wavelength):
+        """Evaluate our response on a validated wavelength grid.
+
+        Results are cached for each distinct grid, so that repeated
+        convolutions using the same grid only interpolate once.  The
+        returned array is shared with the cache and so is read only.
+
+        Parameters
+        ----------
+        wavelength : numpy.ndarray
+            A 1D array of wavelength values without units, such as the
+            result of :func:`validate_wavelength_array`.
+
+        Returns
+        -------
+        numpy.ndarray
+            Read-only array of response values at each input wavelength.
+        """
+        # Use the grid contents as the key, rather than its address, so that
+        # a stale entry can never be returned for a recycled array.
+        key = (wavelength.dtype.str, wavelength.tostring())
+        try:
+            return self._grid_cache[key]
+        except KeyError:
+            pass
+        # Our response is zero at both ends, so end-value extrapolation gives
+        # zero outside our wavelength range.
+        idx, w = _linear_interpolation_weights(wavelength, self._wavelength)
+        response = (1 - w) * self.response[idx] + w * self.response[idx + 1]
+        response.flags.writeable = False
+        if len(self._grid_cache) >= _max_grid_cache_size:
+            self._grid_cache.clear()
+        self._grid_cache[key] = response
         return response
 
 
@@ -752,7 +1082,7 @@ class FilterResponse(object):
 
 
     def convolve_with_function(self, function, photon_weighted=True,
-                               units=None, method='trapz'):
+                               units=None, method='trapz', cache=False):
         """Convolve this response with a function of wavelength.
 
         Returns a numerical estimate of the convolution integral :math:`F[R,f]`
@@ -801,6 +1131,14 @@ class FilterResponse(object):
             accurate than the default 'trapz' method, but should be used with
             care since it is also less robust and more sensitive to the
             wavelength grid.
+        cache : bool
+            Remember the result of this convolution, and return it directly
+            from later calls with the same function object and options.
+            Only use this option with functions whose values never change,
+            since the cache is keyed on the function's identity and not its
+            values.  Results are forgotten when the function is deleted or
+            :meth:`clear_convolution_cache` is called.  A cached result with
+            units is read only.
 
         Returns
         -------
@@ -822,6 +1160,13 @@ class FilterResponse(object):
                 'Invalid integration method {0}. Pick one of {1}.'
                 .format(method, _filter_integration_methods.keys()))
 
+        if cache:
+            key = (bool(photon_weighted), units, method)
+            try:
+                return self._function_cache[function][key]
+            except (KeyError, TypeError):
+                pass
+
         # Try to tabulate the function to integrate on our wavelength grid.
         integrand, func_units = \
             tabulate_function_of_wavelength(
@@ -837,28 +1182,50 @@ class FilterResponse(object):
             else:
                 func_units = units
         # Build the integrand by including appropriate weights.
-        integrand *= self.response
-        if photon_weighted:
-            integrand *= self._wavelength / _hc_constant.value
-            if func_units is not None:
-                func_units *= default_wavelength_unit / _hc_constant.unit
-
-        integrator = _filter_integration_methods[method]
-        result = integrator(y = integrand, x=self._wavelength)
+        integrand = self._integrand(integrand, photon_weighted)
+        result = self._integrate(integrand, method)
 
-        # Apply units to the result if the fuction has units.
+        # Apply units to the result if the fuction has units, including
+        # the units of the weights and the integration variable.
         if func_units is not None:
-            result = result * func_units * default_wavelength_unit
+            if photon_weighted:
+                result = result * (func_units * _photon_weighted_unit)
+            else:
+                result = result * (func_units * default_wavelength_unit)
+
+        if cache:
+            # The same result is returned by later calls, so protect it from
+            # in-place changes.  Results without units are immutable scalars.
+            if isinstance(result, np.ndarray):
+                result.flags.writeable = False
+            try:
+                self._function_cache.setdefault(function, {})[key] = result
+            except TypeError:
+                # This function cannot be weakly referenced.
+                pass
         return result
 
 
+    def clear_convolution_cache(self):
+        """Forget all cached convolutions of this response.
+
+        This includes results cached by :meth:`convolve_with_function` and
+        the convolutions prepared for each wavelength grid passed to
+        :meth:`convolve_with_array`.
+        """
+        self._function_cache.clear()
+        self._convolution_cache.clear()
+        self._grid_cache.clear()
+
+
     def convolve_with_array(self, wavelength, values, photon_weighted=True,
                             interpolate=False, axis=-1, units=None,
                             method='trapz'):
         """Convolve this response with a tabulated function of wavelength.
 
-        This is a convenience method that creates a temporary
-        :class:`FilterConvolution` object to perform the convolution. See
+        This is a convenience method that creates a :class:`FilterConvolution`
+        object to perform the convolution, and reuses it for later calls with
+        the same wavelength grid and options. See
         that class' documentation for details on this method's parameters
         and usage. See also the notes :ref:`above <sampling>` about how the
         convolution integrand is sampled.
@@ -899,9 +1266,33 @@ class FilterResponse(object):
             multidimensional, then so is the result but with the specified
             axis integrated out.
         """
+        convolution = self._get_convolution(
+            wavelength, photon_weighted, interpolate, units)
+        return convolution(values, axis, method)
+
+
+    def _get_convolution(self, wavelength, photon_weighted, interpolate,
+                         units):
+        """Return a convolution of this response on a wavelength grid.
+
+        Convolutions are cached for each distinct combination of grid and
+        options, so that repeated calls with the same grid only prepare the
+        convolution once.  Since a cached convolution is shared, it should
+        only be called and never modified.
+        """
+        wavelength = validate_wavelength_array(wavelength, min_length=2)
+        key = (wavelength.dtype.str, wavelength.tostring(),
+               bool(photon_weighted), bool(interpolate), units)
+        try:
+            return self._convolution_cache[key]
+        except KeyError:
+            pass
         convolution = FilterConvolution(
             self, wavelength, photon_weighted, interpolate, units)
-        return convolution(values, axis, method)
+        if len(self._convolution_cache) >= _max_grid_cache_size:
+            self._convolution_cache.clear()
+        self._convolution_cache[key] = convolution
+        return convolution
 
 
     def get_ab_maggies(self, spectrum, wavelength=None, axis=-1):
@@ -944,10 +1335,9 @@ class FilterResponse(object):
             convolution = self.convolve_with_array(
                 wavelength, spectrum, photon_weighted=True,
                 interpolate=True, axis=axis, units=default_flux_unit)
-        try:
-            return convolution.value / self.ab_zeropoint.value
-        except AttributeError:
-            return convolution / self.ab_zeropoint.value
+        if isinstance(convolution, astropy.units.Quantity):
+            convolution = convolution.value
+        return convolution / self._ab_zero_value
 
 
     def get_ab_magnitude(self, spectrum, wavelength=None, axis=-1):
@@ -973,7 +1363,9 @@ class FilterResponse(object):
         -------
         float or array
         """
-        maggies = self.get_ab_maggies(spectrum, wavelength, axis)
+        # Always calculate magnitudes in double precision.
+        maggies = np.asarray(
+            self.get_ab_maggies(spectrum, wavelength, axis), dtype=float)
         return -2.5 * np.log10(maggies)
 
 
@@ -1021,6 +1413,13 @@ class FilterConvolution(object):
         the values passed to a :meth:`convolution <__call__>` must be
         convertible to these units. When values are passed without units
         they are assumed to be in these units.
+    dtype : numpy dtype or None
+        Floating point type used to evaluate convolutions, which must be
+        either float32 or float64.  Values passed to a :meth:`convolution
+        <__call__>` are converted to this type.  When None, float32 values
+        are convolved in single precision and any other values in double
+        precision.  Single precision halves the memory traffic of large
+        convolutions, at the cost of reduced accuracy.
 
     Attributes
     ----------
@@ -1049,9 +1448,12 @@ class FilterConvolution(object):
     quad_weight : :class:`astropy.units.Quantity` or None
         Array of weights corresponding to each ``quad_wavelength``.  Will be
         None if the parameter ``photon_weighted = False``.
+    dtype : numpy.dtype or None
+        Floating point type used to evaluate convolutions, or None.
     """
     def __init__(self, response, wavelength,
-                 photon_weighted=True, interpolate=False, units=None):
+                 photon_weighted=True, interpolate=False, units=None,
+                 dtype=None):
 
         if isinstance(response, basestring):
             self.response = load_filter(response)
@@ -1059,6 +1461,8 @@ class FilterConvolution(object):
             self.response = response
         self._wavelength = validate_wavelength_array(wavelength, min_length=2)
         self.num_wavelength = len(self._wavelength)
+        self._photon_weighted = photon_weighted
+        self._interpolate = interpolate
 
         # Check if extrapolation would be required.
         under = (self._wavelength[0] > self.response._wavelength[0])
@@ -1086,7 +1490,7 @@ class FilterConvolution(object):
             self._wavelength = self._wavelength[self.response_slice]
 
         # Linearly interpolate the filter response to our wavelength grid.
-        self.response_grid = self.response(self._wavelength)
+        self.response_grid = self.response._response_on_grid(self._wavelength)
 
         # Test if our grid is samples the response with sufficient density. Our
         # criterion is that at most one internal response wavelength (i.e.,
@@ -1102,11 +1506,35 @@ class FilterConvolution(object):
                 self.interpolate_wavelength = (
                     self.response._wavelength[undersampled])
                 self.interpolate_response = self.response.response[undersampled]
-                self.quad_wavelength = np.hstack(
-                    [self._wavelength, self.interpolate_wavelength])
-                self.interpolate_sort_order = np.argsort(self.quad_wavelength)
-                self.quad_wavelength = self.quad_wavelength[
-                    self.interpolate_sort_order]
+                # Precompute how to linearly interpolate input values, which
+                # are tabulated on our wavelength grid.
+                (self._interpolate_index,
+                 self._interpolate_weight) = _linear_interpolation_weights(
+                    self.interpolate_wavelength, self._wavelength)
+                # Insert the interpolated wavelengths into our grid, which
+                # are both already sorted, without sorting their
+                # concatenation.  The position of each value in the merged
+                # grid is its own index plus the number of values from the
+                # other grid that precede it, with ties placing interpolated
+                # values first.
+                num_grid = len(self._wavelength)
+                grid_position = np.arange(num_grid) + np.searchsorted(
+                    self.interpolate_wavelength, self._wavelength,
+                    side='right')
+                self._interpolate_insert_index = insert_index[
+                    undersampled - 1]
+                interpolate_position = (
+                    np.arange(len(self.interpolate_wavelength)) +
+                    self._interpolate_insert_index)
+                self.quad_wavelength = np.insert(
+                    self._wavelength, self._interpolate_insert_index,
+                    self.interpolate_wavelength)
+                self.interpolate_sort_order = np.empty(
+                    len(self.quad_wavelength), dtype=int)
+                self.interpolate_sort_order[grid_position] = np.arange(
+                    num_grid)
+                self.interpolate_sort_order[interpolate_position] = (
+                    num_grid + np.arange(len(self.interpolate_wavelength)))
             else:
                 raise ValueError(
                     'Wavelengths undersample the response ' +
@@ -1118,11 +1546,14 @@ class FilterConvolution(object):
             self.quad_wavelength = self._wavelength
 
         # Replace the quadrature endpoints with the actual filter endpoints
-        # to eliminate any overrun.
-        if self.quad_wavelength[0] < self.response._wavelength[0]:
-            self.quad_wavelength[0] = self.response._wavelength[0]
-        if self.quad_wavelength[-1] > self.response._wavelength[-1]:
-            self.quad_wavelength[-1] = self.response._wavelength[-1]
+        # to eliminate any overrun.  Only the endpoints can lie outside the
+        # filter, so this is a clip of the whole grid.  Copy first if our
+        # quadrature grid is still a view of the validated input
+        # wavelengths, which belong to the caller.
+        if self.quad_wavelength is self._wavelength:
+            self.quad_wavelength = self.quad_wavelength.copy()
+        np.clip(self.quad_wavelength, self.response._wavelength[0],
+                self.response._wavelength[-1], out=self.quad_wavelength)
 
         if photon_weighted:
             # Precompute the weights to use.
@@ -1130,6 +1561,43 @@ class FilterConvolution(object):
         else:
             self.quad_weight = None
 
+        # Tabulate the response at each quadrature wavelength.
+        if self.interpolate_wavelength is not None:
+            self._quad_response = np.hstack(
+                [self.response_grid, self.interpolate_response])[
+                    self.interpolate_sort_order]
+        else:
+            self._quad_response = self.response_grid
+
+        # Combine the response and any weights with the trapezoid rule
+        # coefficients, so that a trapz convolution of any number of spectra
+        # is a single contraction of their values along the wavelength axis.
+        self._trap_weight = self._quad_response * _trapz_weights(
+            self.quad_wavelength)
+        if photon_weighted:
+            self._trap_weight *= self.quad_weight
+
+        # Fold the combined weights of any interpolated values back onto the
+        # input samples they are interpolated from, to obtain equivalent
+        # trapz weights for each value on the full input wavelength grid.
+        self._grid_weight = np.zeros(self.num_wavelength)
+        start = self.response_slice.start
+        num_grid = len(self._wavelength)
+        if self.interpolate_wavelength is not None:
+            unsorted_weight = np.empty_like(self._trap_weight)
+            unsorted_weight[self.interpolate_sort_order] = self._trap_weight
+            self._grid_weight[start:start + num_grid] = (
+                unsorted_weight[:num_grid])
+            interpolated_weight = unsorted_weight[num_grid:]
+            index = start + self._interpolate_index
+            np.add.at(self._grid_weight, index,
+                      (1 - self._interpolate_weight) * interpolated_weight)
+            np.add.at(self._grid_weight, index + 1,
+                      self._interpolate_weight * interpolated_weight)
+        else:
+            self._grid_weight[start:start + num_grid] = self._trap_weight
+        self._slice_weight = self._grid_weight[self.response_slice]
+
         # Save the expected input value units.
         self.input_units = units
         if self.input_units is not None:
@@ -1141,8 +1609,65 @@ class FilterConvolution(object):
         else:
             self.output_units = None
 
+        # Single-precision copies of our arrays are created on demand, or
+        # else immediately when single precision is requested.
+        self._single_precision_arrays = None
+        self.dtype = None if dtype is None else np.dtype(dtype)
+        if self.dtype is not None:
+            if self.dtype not in (np.float32, np.float64):
+                raise ValueError(
+                    'Invalid dtype {0}, pick float32 or float64.'
+                    .format(self.dtype))
+            self._working_arrays(self.dtype)
+
+
+    def with_new_wavelength(self, wavelength, interpolate=None):
+        """Create a convolution of the same response on a new wavelength grid.
+
+        The new convolution uses the same filter response object and options
+        as this one, so only the coefficients that depend on the wavelength
+        grid are recalculated.
+
+        Parameters
+        ----------
+        wavelength : array or :class:`astropy.units.Quantity`
+            A valid array of wavelengths that must cover the full range of
+            our filter response.  See :class:`FilterConvolution` for details.
+        interpolate : bool or None
+            Whether to interpolate the new tabulated values, or use the same
+            option as this convolution when None.
+
+        Returns
+        -------
+        FilterConvolution
+            A new convolution object.
+        """
+        if interpolate is None:
+            interpolate = self._interpolate
+        return FilterConvolution(
+            self.response, wavelength, photon_weighted=self._photon_weighted,
+            interpolate=interpolate, units=self.input_units, dtype=self.dtype)
 
-    def __call__(self, values, axis=-1, method='trapz', plot=False):
+
+    def _working_arrays(self, dtype):
+        """Return our arrays in the working precision for values of dtype.
+
+        Returns a tuple (quad_response, quad_weight, slice_weight) in single
+        precision when dtype is float32, or else in double precision.
+        """
+        arrays = (self._quad_response, self.quad_weight, self._slice_weight)
+        if dtype != np.float32:
+            return arrays
+        if self._single_precision_arrays is None:
+            self._single_precision_arrays = tuple(
+                None if array is None else
+                np.ascontiguousarray(array, dtype=np.float32)
+                for array in arrays)
+        return self._single_precision_arrays
+
+
+    def __call__(self, values, axis=-1, method='trapz', plot=False,
+                 sparse=False):
         """Evaluate the convolution for arbitrary tabulated function values.
 
         Parameters
@@ -1168,6 +1693,12 @@ class FilterConvolution(object):
             and does not support multidimensional input values.  This option
             is primarily intended for debugging and to generate figures for
             the documentation.
+        sparse : bool
+            Only integrate over the range of wavelengths where any values
+            are non-zero.  This is faster for values that are zero over most
+            of the filter response, such as emission line templates, but
+            involves an extra pass over the values so should not be used
+            otherwise.  Only affects the 'trapz' method.
 
         Returns
         -------
@@ -1183,33 +1714,36 @@ class FilterConvolution(object):
                 'Invalid method "{0}", pick one of {1}.'
                 .format(method, _filter_integration_methods.keys()))
 
-        values_no_units = np.asarray(values)
+        values_no_units = np.asarray(values, dtype=self.dtype)
         if values_no_units.shape[axis] != self.num_wavelength:
             raise ValueError(
                 'Expected {0} values along axis {1}.'
                 .format(len(self._wavelength), axis))
+        axis = axis % values_no_units.ndim
         values_slice = [slice(None)] * len(values_no_units.shape)
         values_slice[axis] = self.response_slice
-        values_no_units = values_no_units[values_slice]
-
-        try:
-            # If the input values have units, they must be convertible to
-            # to our input units, which must be specified.
-            values_no_units *= values.unit.to(self.input_units)
-            input_has_units = True
-        except AttributeError:
-            # Input values have no units, so we assume that they are in
-            # self.input_units if these are defined, or else that the caller
-            # knows what they are doing.
-            input_has_units = False
-        except TypeError:
-            # The input values have units but self.input_units is None.
-            raise ValueError(
-                'Must specify expected units for values with units.')
-        except astropy.units.UnitConversionError:
-            raise ValueError(
-                'Values units {0} not convertible to {1}.'
-                .format(values.unit, self.input_units))
+        values_no_units = values_no_units[tuple(values_slice)]
+
+        # If the input values have units, they must be convertible to our
+        # input units, which must be specified.  Otherwise, we assume that
+        # they are in self.input_units if these are defined, or else that
+        # the caller knows what they are doing.
+        values_unit = getattr(values, 'unit', None)
+        input_has_units = values_unit is not None
+        if input_has_units:
+            if self.input_units is None:
+                raise ValueError(
+                    'Must specify expected units for values with units.')
+            try:
+                scale = _unit_scale(values_unit, self.input_units)
+            except astropy.units.UnitConversionError:
+                raise ValueError(
+                    'Values units {0} not convertible to {1}.'
+                    .format(values_unit, self.input_units))
+            # Only convert when necessary, and never in place since our
+            # values might be a view of the caller's array.
+            if scale != 1.:
+                values_no_units = values_no_units * scale
 
         if plot:
             if len(values_no_units.shape) != 1:
@@ -1236,58 +1770,85 @@ class FilterConvolution(object):
                 self._wavelength, values_no_units, 'bs-', label='input')
             right_axis.set_ylim(0., 1.1 * np.max(values_no_units))
 
-        # Multiply values by the response.
-        response_shape = np.ones_like(values_no_units.shape, dtype=int)
-        response_shape[axis] = len(self.response_grid)
-        integrand = values_no_units * self.response_grid.reshape(response_shape)
-
-        if self.interpolate_wavelength is not None:
-            # Interpolate the input values.
-            interpolator = scipy.interpolate.interp1d(
-                self._wavelength, values_no_units, axis=axis, kind='linear',
-                copy=False, assume_sorted=True, bounds_error=True)
-            interpolated_values = interpolator(self.interpolate_wavelength)
-            if plot:
-                # Show the interpolation locations.
-                plt.scatter(
-                    self.interpolate_wavelength, interpolated_values,
-                    s=30, marker='o', edgecolor='b', facecolor='none',
-                    label='interpolated')
-            # Multiply interpolated values by the response.
-            response_shape[axis] = len(self.interpolate_wavelength)
-            interpolated_integrand = (
-                interpolated_values *
-                self.interpolate_response.reshape(response_shape))
-            # Update the integrand with the interpolated values.
-            integrand = np.concatenate(
-                (integrand, interpolated_integrand), axis=axis)
-            # Resort by wavelength.
-            values_slice[axis] = self.interpolate_sort_order
-            integrand = integrand[values_slice]
+        # Single-precision values are convolved in single precision.
+        quad_response, quad_weight, slice_weight = (
+            self._working_arrays(values_no_units.dtype))
+
+        if method == 'trapz' and not plot:
+            if sparse:
+                # Find the range of wavelengths with any non-zero values.
+                non_zero = np.rollaxis(
+                    values_no_units != 0, axis, values_no_units.ndim)
+                non_zero = np.flatnonzero(np.any(
+                    non_zero.reshape(-1, non_zero.shape[-1]), axis=0))
+                if len(non_zero) > 0:
+                    start, stop = non_zero[0], non_zero[-1] + 1
+                else:
+                    start, stop = 0, 0
+                values_slice[axis] = slice(start, stop)
+                values_no_units = values_no_units[tuple(values_slice)]
+                slice_weight = slice_weight[start:stop]
+            # Our weights already include the response, any interpolation
+            # and the trapezoid rule, so this is a single contraction of the
+            # input values without any temporary arrays.
+            if values_no_units.ndim == 1:
+                integral = np.dot(values_no_units, slice_weight)
+            else:
+                integral = np.tensordot(
+                    values_no_units, slice_weight, axes=([axis], [0]))
+        else:
+            # Tabulate the integrand explicitly on our quadrature grid.
+            if self.interpolate_wavelength is not None:
+                # Interpolate the input values using our precomputed weights.
+                weight = _broadcast_along(
+                    self._interpolate_weight, values_no_units.ndim, axis)
+                interpolated_values = (
+                    (1 - weight) * np.take(
+                        values_no_units, self._interpolate_index, axis=axis) +
+                    weight * np.take(
+                        values_no_units, self._interpolate_index + 1,
+                        axis=axis))
+                if plot:
+                    # Show the interpolation locations.
+                    plt.scatter(
+                        self.interpolate_wavelength, interpolated_values,
+                        s=30, marker='o', edgecolor='b', facecolor='none',
+                        label='interpolated')
+                # Insert the interpolated values in wavelength order.
+                quad_values = np.insert(
+                    values_no_units, self._interpolate_insert_index,
+                    interpolated_values.astype(values_no_units.dtype),
+                    axis=axis)
+            else:
+                quad_values = values_no_units
 
-        if plot:
-            # Plot integrand before applying weights, so we can re-use
-            # the right-hand axis scale.
-            plt.fill_between(
-                self.quad_wavelength, integrand,
-                color='g', lw=0, alpha=0.25)
-            plt.plot(
-                self.quad_wavelength, integrand,
-                'g-', alpha=0.5, label='filtered')
-            right_axis.legend(loc='center right')
-            xpad = 0.05 * (
-                self.quad_wavelength[-1] - self.quad_wavelength[0])
-            plt.xlim(self._wavelength[0] - xpad,
-                     self._wavelength[-1] + xpad)
-
-        if self.quad_weight is not None:
-            # Apply weights.
-            response_shape[axis] = len(self.quad_weight)
-            integrand *= self.quad_weight.reshape(response_shape)
+            # Multiply values by the response.
+            integrand = quad_values * _broadcast_along(
+                quad_response, quad_values.ndim, axis)
 
-        integrator = _filter_integration_methods[method]
-        integral = integrator(
-            y=integrand, x=self.quad_wavelength, axis=axis)
+            if plot:
+                # Plot integrand before applying weights, so we can re-use
+                # the right-hand axis scale.
+                plt.fill_between(
+                    self.quad_wavelength, integrand,
+                    color='g', lw=0, alpha=0.25)
+                plt.plot(
+                    self.quad_wavelength, integrand,
+                    'g-', alpha=0.5, label='filtered')
+                right_axis.legend(loc='center right')
+                xpad = 0.05 * (
+                    self.quad_wavelength[-1] - self.quad_wavelength[0])
+                plt.xlim(self._wavelength[0] - xpad,
+                         self._wavelength[-1] + xpad)
+
+            if quad_weight is not None:
+                # Apply weights.
+                integrand *= _broadcast_along(
+                    quad_weight, integrand.ndim, axis)
+
+            integrator = _filter_integration_methods[method]
+            integral = integrator(
+                y=integrand, x=self.quad_wavelength, axis=axis)
 
         if input_has_units:
             # Apply the output units.
@@ -1348,6 +1909,15 @@ class FilterSequence(collections.Sequence):
     """
     def __init__(self, responses):
         self._responses = list(responses)
+        # Our responses never change, so their names and effective
+        # wavelengths can be collected once now.
+        self._names = tuple(r.name for r in self._responses)
+        self._effective_wavelengths = np.array(
+            [r.effective_wavelength.value for r in self._responses]
+            ) * default_wavelength_unit
+        self._effective_wavelengths.flags.writeable = False
+        self._weights_cache = {}
+        self._function_weights = None
 
 
     def __contains__(self, item):
@@ -1368,14 +1938,12 @@ class FilterSequence(collections.Sequence):
 
     @property
     def names(self):
-        return [r.name for r in self]
+        return list(self._names)
 
 
     @property
     def effective_wavelengths(self):
-        return [
-            r.effective_wavelength.value for r in self
-            ] * default_wavelength_unit
+        return self._effective_wavelengths
 
 
     def get_ab_maggies(self, spectrum, wavelength=None, axis=-1):
@@ -1403,21 +1971,15 @@ class FilterSequence(collections.Sequence):
             spectrum data is multidimensional, its first index is mapped to rows
             of the returned table.
         """
-        t = astropy.table.Table(meta=dict(
-            description='Created by speclite <speclite.readthedocs.org>'))
-        for r in self:
-            data = r.get_ab_maggies(spectrum, wavelength, axis)
-            if np.isscalar(data):
-                data = [data]
-            t.add_column(astropy.table.Column(name=r.name, data=data))
-        return t
+        return self._make_table(
+            self._get_maggies(spectrum, wavelength, axis))
 
 
     def get_ab_magnitudes(self, spectrum, wavelength=None, axis=-1):
         """Calculate a spectrum's AB magnitude.
 
-        Calls :meth:`FilterResponse.get_ab_magnitude` for each filter in this
-        sequence and returns the results in a structured array.
+        Calculates the same results as :meth:`FilterResponse.get_ab_magnitude`
+        for each filter in this sequence and returns them in a table.
 
         Parameters
         ----------
@@ -1436,14 +1998,214 @@ class FilterSequence(collections.Sequence):
             spectrum data is multidimensional, its first index is mapped to rows
             of the returned table.
         """
-        t = astropy.table.Table(meta=dict(
-            description='Created by speclite <speclite.readthedocs.org>'))
-        for r in self:
-            data = r.get_ab_magnitude(spectrum, wavelength, axis)
-            if data.shape == ():
-                data = [data]
-            t.add_column(astropy.table.Column(name=r.name, data=data))
-        return t
+        # Always calculate magnitudes in double precision, for all filters
+        # at once.
+        maggies = np.asarray(
+            self._get_maggies(spectrum, wavelength, axis), dtype=float)
+        return self._make_table(-2.5 * np.log10(maggies))
+
+
+    def _get_maggies(self, spectrum, wavelength, axis):
+        """Calculate the maggies for each filter in this sequence.
+
+        Returns an array whose first axis indexes our filters.
+
+        Maggies for a tabulated spectrum are calculated for all filters at
+        once, by contracting the spectrum values with a matrix of weights.
+        A callable spectrum is similarly tabulated only once, on the union
+        of our filter wavelength grids.
+        """
+        if wavelength is None:
+            return self._get_function_maggies(spectrum)
+        spectrum, wavelength = self._prepare_arrays(spectrum, wavelength)
+        if spectrum.shape[axis] != len(wavelength):
+            raise ValueError(
+                'Expected {0} values along axis {1}.'
+                .format(len(wavelength), axis))
+        weights = self._get_maggies_weights(
+            wavelength, np.float32 if spectrum.dtype == np.float32
+            else np.float64)
+        maggies = np.tensordot(spectrum, weights, axes=([axis], [1]))
+        if not np.all(np.isfinite(maggies)):
+            # Some values are not finite, so convolve each filter separately
+            # to only use values within its own wavelength range.
+            return self._collect(
+                lambda r: r.get_ab_maggies(spectrum, wavelength, axis))
+        return np.rollaxis(maggies, -1)
+
+
+    def _get_function_maggies(self, function):
+        """Calculate an array of maggies for a callable spectrum.
+
+        The result is equivalent to calling
+        :meth:`FilterResponse.get_ab_maggies` for each filter, but the
+        function is only evaluated once on the union of our wavelength grids,
+        and each filter's trapezoid rule integral is calculated as a row of a
+        single matrix product.
+        """
+        if self._function_weights is None:
+            grid = np.unique(np.concatenate(
+                [r._wavelength for r in self._responses]))
+            weights = np.zeros((len(self), len(grid)))
+            for i, r in enumerate(self):
+                index = np.searchsorted(grid, r._wavelength)
+                weights[i, index] = (
+                    _trapz_weights(r._wavelength) * r._photon_response /
+                    r._ab_zero_value)
+            weights.flags.writeable = False
+            self._function_weights = grid, weights
+        grid, weights = self._function_weights
+
+        values, func_units = tabulate_function_of_wavelength(
+            function, grid * default_wavelength_unit)
+        if func_units is not None:
+            try:
+                func_units.to(default_flux_unit)
+            except astropy.units.UnitConversionError:
+                raise ValueError(
+                    'Function units {0} not convertible to {1}.'
+                    .format(func_units, default_flux_unit))
+        if np.shape(values) != grid.shape:
+            values = values * np.ones(grid.shape)
+        maggies = np.dot(weights, values)
+        if not np.all(np.isfinite(maggies)):
+            # Only use values within each filter's own wavelength range.
+            return self._collect(lambda r: r.get_ab_maggies(function))
+        return maggies
+
+
+    def _collect(self, get_result):
+        """Collect the result of calling get_result for each filter.
+
+        Results are copied into a single preallocated array whose first axis
+        indexes our filters.
+        """
+        results = None
+        for i, r in enumerate(self):
+            result = np.asarray(get_result(r))
+            if results is None:
+                results = np.empty(
+                    (len(self),) + result.shape, dtype=result.dtype)
+            results[i] = result
+        return results
+
+
+    def _get_maggies_weights(self, wavelength, dtype=np.float64):
+        """Return a matrix of maggies weights for a validated wavelength grid.
+
+        Row i contains the weights that convert spectrum values on the grid
+        into maggies for filter i.  Matrices are cached for each distinct
+        grid and dtype, with single-precision weights converted from the
+        double-precision ones.
+        """
+        dtype = np.dtype(dtype)
+        key = (wavelength.dtype.str, wavelength.tostring(), dtype.str)
+        try:
+            return self._weights_cache[key]
+        except KeyError:
+            pass
+        if dtype != np.float64:
+            weights = self._get_maggies_weights(wavelength).astype(dtype)
+        else:
+            weights = np.empty((len(self), len(wavelength)))
+            for i, r in enumerate(self):
+                # Allow interpolation since this is a convenience method.
+                convolution = r._get_convolution(
+                    wavelength, photon_weighted=True, interpolate=True,
+                    units=default_flux_unit)
+                weights[i] = convolution._grid_weight / r._ab_zero_value
+        weights.flags.writeable = False
+        if len(self._weights_cache) >= _max_grid_cache_size:
+            self._weights_cache.clear()
+        self._weights_cache[key] = weights
+        return weights
+
+
+    def compile_for(self, wavelength, dtype=None):
+        """Prepare a fast function to calculate maggies on a fixed grid.
+
+        The returned function calculates the maggies of tabulated spectra in
+        every band of this sequence with a single matrix product, and is
+        intended for applications that convolve many spectra on the same
+        wavelength grid.  For example:
+
+        >>> sdss = load_filters('sdss2010-*')
+        >>> wlen = np.linspace(2000, 12000, 500)
+        >>> get_maggies = sdss.compile_for(wlen)
+        >>> maggies = get_maggies(np.ones((4, len(wlen))) * 1e-17)
+        >>> print(maggies.shape)
+        (4, 5)
+
+        The results agree with :meth:`get_ab_maggies` when all values are
+        finite.  Since every value contributes to the matrix product, even
+        values outside of a band's wavelength range must be finite.
+
+        Parameters
+        ----------
+        wavelength : array
+            A :func:`valid array <validate_wavelength_array>` of wavelengths
+            that must cover the full range of each filter response.
+        dtype : numpy dtype or None
+            Floating point type of the weights used by the returned function.
+            Use float32 to halve the memory traffic when calculating maggies
+            for large single-precision arrays.  When None, use double
+            precision.
+
+        Returns
+        -------
+        callable
+            Function of an array of spectrum values without units, which are
+            assumed to be in :attr:`default_flux_unit` and tabulated along
+            the last axis, that returns an array of maggies with the last
+            axis now indexing the bands of this sequence.
+        """
+        weights = self._get_maggies_weights(
+            validate_wavelength_array(wavelength)).T
+        if dtype is not None:
+            weights = np.ascontiguousarray(weights, dtype=dtype)
+
+        def get_maggies(values):
+            return np.dot(values, weights)
+        return get_maggies
+
+
+    def _prepare_arrays(self, spectrum, wavelength):
+        """Prepare tabulated spectrum arrays for convolution with each filter.
+
+        The wavelengths are validated and any flux units are removed once
+        here, instead of separately for each filter.  A callable spectrum
+        is returned unchanged.
+        """
+        if wavelength is None:
+            return spectrum, wavelength
+        wavelength = validate_wavelength_array(wavelength)
+        unit = getattr(spectrum, 'unit', None)
+        spectrum = np.asarray(spectrum)
+        if unit is not None:
+            try:
+                scale = unit.to(default_flux_unit)
+            except astropy.units.UnitConversionError:
+                raise ValueError(
+                    'Values units {0} not convertible to {1}.'
+                    .format(unit, default_flux_unit))
+            if scale != 1.:
+                spectrum = spectrum * scale
+        return spectrum, wavelength
+
+
+    def _make_table(self, columns):
+        """Build a table with one column of results for each filter.
+
+        The columns are an array whose first axis indexes our filters, and
+        are always newly calculated, so the table can use them directly
+        without copying.
+        """
+        if columns.ndim == 1:
+            # Scalar results for each filter become a single row.
+            columns = columns[:, np.newaxis]
+        return astropy.table.Table(
+            list(columns), names=self._names, copy=False, meta=dict(
+                description='Created by speclite <speclite.readthedocs.org>'))
 
 
 def load_filters(*names):
@@ -1485,28 +2247,117 @@ def load_filters(*names):
     for name in names:
         group_match = _group_wildcard.match(name)
         if group_match:
-            # Scan data/filters/ for bands in this group.
-            band_names = []
-            band_weff = []
-            file_names = glob.glob(
-                os.path.join(filters_path, '{0}.ecsv'.format(name)))
-            for file_name in file_names:
-                full_name, _ = os.path.splitext(os.path.basename(file_name))
-                band_names.append(full_name)
-                response = load_filter(full_name)
-                band_weff.append(response.effective_wavelength)
             # Add bands in order of increasing effective wavelength.
             names_to_load.extend(
-                [name for (weff, name) in sorted(zip(band_weff, band_names))])
+                _sorted_filter_group(group_match.group(1), filters_path))
         else:
             names_to_load.append(name)
+    # Read any filters that are not already cached using a pool of threads,
+    # to overlap their file I/O.  Custom filters are cached under their
+    # canonical name rather than their file name, so always count as missing.
+    # Threads are not used while a module is being imported under python 2,
+    # since any import in a worker thread would then wait forever for the
+    # global import lock held by this thread.
+    loaded = {}
+    missing = [name for name in set(names_to_load)
+               if name not in _filter_cache]
+    if len(missing) >= _min_thread_pool_loads and not imp.lock_held():
+        pool = multiprocessing.pool.ThreadPool(
+            min(len(missing), _max_thread_pool_size))
+        try:
+            loaded = dict(zip(missing, pool.map(load_filter, missing)))
+        finally:
+            pool.close()
+            pool.join()
     # Load filters and return them wrapped in a FilterSequence.
     responses = []
     for name in names_to_load:
-        responses.append(load_filter(name))
+        response = loaded.get(name)
+        if response is None:
+            response = load_filter(name)
+        responses.append(response)
     return FilterSequence(responses)
 
 
+def _list_filter_files(filters_path):
+    """Return the names of the files in a directory of filter responses.
+
+    The directory is only listed the first time this function is called for
+    each path, since the standard filters do not change while running.
+    """
+    try:
+        return _filter_listing_cache[filters_path]
+    except KeyError:
+        listing = tuple(sorted(os.listdir(filters_path)))
+        _filter_listing_cache[filters_path] = listing
+        return listing
+
+
+def _load_filter_index(filters_path):
+    """Return the index of effective wavelengths for a filter directory.
+
+    The index is a dictionary of effective wavelengths in
+    :attr:`default_wavelength_unit`, keyed by canonical name, that is read
+    from the directory the first time this function is called for each
+    path.  An empty dictionary is returned if the index is missing or
+    cannot be read.
+    """
+    try:
+        return _filter_index_cache[filters_path]
+    except KeyError:
+        pass
+    try:
+        with open(os.path.join(filters_path, _filter_index_name)) as f:
+            index = dict(json.load(f))
+    except (IOError, OSError, ValueError, TypeError):
+        index = {}
+    _filter_index_cache[filters_path] = index
+    return index
+
+
+def _write_filter_index(filters_path=None):
+    """Write the index of effective wavelengths for a filter directory.
+
+    This should be run whenever a standard filter is added or modified,
+    so that :func:`load_filters` can order the bands of a group without
+    loading them::
+
+        python -c 'from speclite.filters import _write_filter_index as w; w()'
+
+    Returns the name of the index file that was written.
+    """
+    if filters_path is None:
+        filters_path = astropy.utils.data._find_pkg_data_path('data/filters/')
+    index = {}
+    for file_name in os.listdir(filters_path):
+        full_name, extension = os.path.splitext(file_name)
+        if extension == '.ecsv':
+            response = load_filter(os.path.join(filters_path, file_name),
+                                   load_from_cache=False)
+            index[full_name] = float(response.effective_wavelength.value)
+    index_name = os.path.join(filters_path, _filter_index_name)
+    with open(index_name, 'w') as f:
+        json.dump(index, f, indent=0, separators=(',', ': '),
+                  sort_keys=True)
+        f.write('\n')
+    _filter_index_cache.pop(filters_path, None)
+    return index_name
+
+
+def _peek_effective_wavelength(name, filters_path):
+    """Return the effective wavelength of a standard filter as a float.
+
+    The value is in :attr:`default_wavelength_unit`, and is taken from an
+    already loaded response or else from the directory index, so that the
+    filter is only loaded here when it is missing from the index.
+    """
+    if name not in _filter_cache:
+        index = _load_filter_index(filters_path)
+        if name in index:
+            return index[name]
+    return load_filter(name).effective_wavelength.value
+
+
 def load_filter(name, load_from_cache=True, verbose=False):
     """Load a single filter response by name.
 
@@ -1555,26 +2406,58 @@ def load_filter(name, load_from_cache=True, verbose=False):
         File is incorrectly formatted.  This should never happen for the
         files included in the source code distribution.
     """
-    if load_from_cache and name in _filter_cache:
-        if verbose:
-            print('Returning cached filter response "{0}"'.format(name))
-        return _filter_cache[name]
-    # Is this a non-standard filter file?
-    base_name, extension = os.path.splitext(name)
-    if extension not in ('', '.ecsv'):
-        raise ValueError(
-            'Invalid extension for filter file name: "{0}".'.format(extension))
-    if extension:
-        file_name = name
-    else:
-        file_name = astropy.utils.data._find_pkg_data_path(
-            'data/filters/{0}.ecsv'.format(name))
-    if not os.path.isfile(file_name):
-        raise ValueError('No such filter file "{0}".'.format(file_name))
+    if load_from_cache:
+        # A single dictionary lookup for the common case of a cached filter.
+        response = _filter_cache.get(name)
+        if response is not None:
+            if verbose:
+                print('Returning cached filter response "{0}"'.format(name))
+            return response
+    # Only one thread at a time reads each file, so that threads requesting
+    # the same filter concurrently share a single load.
+    with _filter_load_locks[hash(name) % len(_filter_load_locks)]:
+        if load_from_cache:
+            response = _filter_cache.get(name)
+            if response is not None:
+                if verbose:
+                    print('Returning cached filter response "{0}"'
+                          .format(name))
+                return response
+        return _load_filter_file(name, verbose)
+
+
+def _load_filter_file(name, verbose):
+    """Load a filter response from disk.
+
+    This is the implementation of :func:`load_filter` when the cache is not
+    used, and should only be called with the load lock held.
+    """
+    file_name = _standard_filter_path(name)
+    if file_name is None:
+        # Is this a non-standard filter file?
+        base_name, extension = os.path.splitext(name)
+        if extension not in ('', '.ecsv'):
+            raise ValueError(
+                'Invalid extension for filter file name: "{0}".'
+                .format(extension))
+        if extension:
+            file_name = name
+        else:
+            file_name = astropy.utils.data._find_pkg_data_path(
+                'data/filters/{0}.ecsv'.format(name))
+        if not os.path.isfile(file_name):
+            raise ValueError('No such filter file "{0}".'.format(file_name))
     if verbose:
         print('Loading filter response from "{0}".'.format(file_name))
-    table = astropy.table.Table.read(
-        file_name, format='ascii.ecsv', guess=False)
+    cache_name = _disk_cache_name(file_name)
+    if cache_name is not None:
+        response = _load_filter_fast(file_name, cache_name)
+        if response is not None:
+            return response
+    table = _read_ecsv_fast(file_name)
+    if table is None:
+        table = astropy.table.Table.read(
+            file_name, format='ascii.ecsv', guess=False)
 
     if 'wavelength' not in table.colnames:
         raise RuntimeError('Table is missing required wavelength column.')
@@ -1590,7 +2473,238 @@ def load_filter(name, load_from_cache=True, verbose=False):
         raise RuntimeError('Response column has unexpected units.')
     response = response_column.data
 
-    return FilterResponse(wavelength, response, table.meta)
+    filter_response = FilterResponse(wavelength, response, table.meta)
+    if cache_name is not None:
+        _save_filter_fast(file_name, cache_name, wavelength, response,
+                          table.meta)
+    return filter_response
+
+
+def _scan_standard_filters():
+    """Index the files in the standard filter directory by name and group.
+
+    The directory is only scanned the first time this function is called.
+    """
+    if _standard_filter_paths:
+        return
+    filters_path = astropy.utils.data._find_pkg_data_path('data/filters/')
+    # Remembered paths must remain valid if the working directory changes.
+    prefix = os.path.join(os.path.abspath(filters_path), '')
+    paths = {}
+    groups = {}
+    for file_name in _list_filter_files(filters_path):
+        # All names are in the same directory, so use string operations.
+        if file_name.endswith('.ecsv'):
+            full_name = file_name[:-5]
+            paths[full_name] = prefix + file_name
+            group_name = full_name.partition('-')[0]
+            groups.setdefault(group_name, []).append(full_name)
+    # Fill each dictionary in one step, since other threads may be reading
+    # them, with the paths last since they indicate that the scan is done.
+    _standard_filter_groups.update(
+        [(group_name, tuple(band_names))
+         for group_name, band_names in groups.items()])
+    _standard_filter_paths.update(paths)
+
+
+def _standard_filter_path(name):
+    """Return the file name of a standard filter.
+
+    Returns None if the name is not the canonical name of a standard filter.
+    """
+    _scan_standard_filters()
+    return _standard_filter_paths.get(name)
+
+
+def _standard_filter_group(group_name):
+    """Return the canonical names of the standard filters in a group.
+    """
+    _scan_standard_filters()
+    return _standard_filter_groups.get(group_name, ())
+
+
+def _sorted_filter_group(group_name, filters_path):
+    """Return the names in a standard group by increasing effective wavelength.
+
+    The order of each group is only determined the first time this function
+    is called for it.
+    """
+    try:
+        return _sorted_group_cache[group_name]
+    except KeyError:
+        pass
+    band_names = _standard_filter_group(group_name)
+    band_weff = np.array(
+        [_peek_effective_wavelength(band_name, filters_path)
+         for band_name in band_names], dtype=float)
+    # Names are listed alphabetically, so a stable sort breaks any ties in
+    # effective wavelength by name.
+    order = np.argsort(band_weff, kind='mergesort')
+    sorted_names = tuple([band_names[i] for i in order])
+    _sorted_group_cache[group_name] = sorted_names
+    return sorted_names
+
+
+def _read_ecsv_fast(file_name):
+    """Read an ECSV file using the pandas C parser for the table body.
+
+    Only the small YAML header is parsed in python, using the same astropy
+    function as the ECSV reader, so the result is equivalent to calling
+    :meth:`astropy.table.Table.read`.
+
+    Returns None if pandas is not installed or the file cannot be read this
+    way, in which case the caller should fall back to the astropy reader.
+    """
+    if pandas is None:
+        return None
+
+    with open(file_name) as f:
+        # Extract the non-blank header lines with the comment character
+        # stripped, as the astropy ECSV reader does, leaving the file
+        # positioned at the line of column names.
+        header_lines = []
+        while True:
+            position = f.tell()
+            line = f.readline()
+            if not line:
+                return None
+            line = line.strip()
+            if line and not line.startswith('#'):
+                break
+            if line[1:]:
+                header_lines.append(line[1:])
+        f.seek(position)
+        try:
+            header = astropy.table.meta.get_header_from_yaml(header_lines)
+            names = [column['name'] for column in header['datatype']]
+            dtypes = dict(
+                (column['name'], np.dtype(column['datatype']))
+                for column in header['datatype'])
+            frame = pandas.read_csv(
+                f, sep=header.get('delimiter', ' '), dtype=dtypes,
+                engine='c', float_precision='round_trip')
+        except Exception:
+            # Let the astropy reader handle, and report, any problems.
+            return None
+    meta = header.get('meta', {})
+    if list(frame.columns) != names or '__serialized_columns__' in meta:
+        # Leave the reconstruction of mixin columns to astropy.
+        return None
+
+    table = astropy.table.Table(meta=meta)
+    for column in header['datatype']:
+        table[column['name']] = astropy.table.Column(
+            frame[column['name']].values, unit=column.get('unit'),
+            description=column.get('description'))
+    return table
+
+
+def _disk_cache_dir():
+    """Return the directory used for parsed filter files.
+    """
+    return os.path.join(astropy.config.paths.get_cache_dir(), 'speclite')
+
+
+def _disk_cache_name(file_name):
+    """Return the name of the parsed cache of a filter file.
+
+    The cache consists of this ".npy" file of wavelength and response values,
+    and a ".json" file with the same base name containing everything else.
+    Only the standard filter files are cached, so that the cache does not
+    grow with every custom file that is loaded.  Returns None for any other
+    file, or when no cache directory is available.
+    """
+    file_name = os.path.abspath(file_name)
+    filters_path = astropy.utils.data._find_pkg_data_path('data/filters/')
+    if os.path.dirname(file_name) != os.path.abspath(filters_path):
+        return None
+    try:
+        cache_dir = _disk_cache_dir()
+    except (OSError, IOError):
+        return None
+    key = hashlib.md5(file_name.encode('utf-8'))
+    return os.path.join(cache_dir, key.hexdigest() + '.npy')
+
+
+def _file_signature(file_name):
+    """Return the modification time and size of a file.
+    """
+    stat = os.stat(file_name)
+    return np.array([stat.st_mtime, stat.st_size], dtype=float)
+
+
+def _load_filter_fast(file_name, cache_name):
+    """Load a filter response from its parsed cache, bypassing ECSV parsing.
+
+    The values are memory mapped, so that loading them only reads pages
+    from the operating system's file cache, before they are copied into
+    the new response.  Returns None if the cache is missing, unreadable, or
+    was written for a different version of the filter file.
+    """
+    header_name = os.path.splitext(cache_name)[0] + '.json'
+    try:
+        with open(header_name) as f:
+            header = json.load(f)
+        if not np.array_equal(header['signature'], _file_signature(file_name)):
+            return None
+        values = np.load(cache_name, mmap_mode='r')
+        if values.shape != (2, header['size']):
+            return None
+        wavelength = astropy.units.Quantity(
+            values[0], astropy.units.Unit(header['wavelength_unit']),
+            copy=False)
+        response = values[1]
+        meta = header['meta']
+    except (IOError, OSError, KeyError, ValueError, TypeError):
+        return None
+    return FilterResponse(wavelength, response, meta)
+
+
+def _replace_file(name, write):
+    """Replace a file with the contents written by write(f).
+
+    The file is written under a temporary name and renamed, so that a
+    partially written file is never read.
+    """
+    fd, temp_name = tempfile.mkstemp(dir=os.path.dirname(name))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        if os.path.exists(name):
+            os.remove(name)
+        os.rename(temp_name, name)
+    finally:
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+
+
+def _save_filter_fast(file_name, cache_name, wavelength, response, meta):
+    """Save the parsed contents of a filter file for :func:`load_filter`.
+
+    Failures are silently ignored since the cache is only an optimization.
+    The values are written before the header that validates them, so that
+    an incomplete cache is never used.
+    """
+    values = np.vstack((wavelength.value, response)).astype(float)
+    try:
+        header = json.dumps(dict(
+            signature=_file_signature(file_name).tolist(),
+            wavelength_unit=wavelength.unit.to_string(),
+            size=values.shape[1], meta=dict(meta)))
+    except (TypeError, ValueError):
+        # This metadata cannot be cached.
+        return
+    header_name = os.path.splitext(cache_name)[0] + '.json'
+    try:
+        cache_dir = os.path.dirname(cache_name)
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        if os.path.exists(header_name):
+            os.remove(header_name)
+        _replace_file(cache_name, lambda f: np.save(f, values))
+        _replace_file(header_name, lambda f: f.write(header.encode('utf-8')))
+    except (IOError, OSError):
+        pass
 
 
 def plot_filters(responses, wavelength_unit=None,
@@ -1629,11 +2743,14 @@ def plot_filters(responses, wavelength_unit=None,
         wavelength_unit = default_wavelength_unit
 
     # Look up the range of effective wavelengths for this set of filters.
-    effective_wavelengths = responses.effective_wavelengths
-    min_wlen, max_wlen = min(effective_wavelengths), max(effective_wavelengths)
+    effective_wavelengths = responses.effective_wavelengths.value
+    min_wlen = effective_wavelengths.min()
+    max_wlen = effective_wavelengths.max()
 
     import matplotlib.pyplot as plt
     import matplotlib.cm as cm
+    import matplotlib.collections
+    import matplotlib.lines
 
     cmap = cm.get_cmap(cmap)
     fig, ax = plt.subplots()
@@ -1657,26 +2774,44 @@ def plot_filters(responses, wavelength_unit=None,
             pass
         plt.xlim(wlen_min, wlen_max)
 
-    for response, wlen in zip(responses, effective_wavelengths):
-        if max_wlen > min_wlen:
-            # Use an approximate spectral color for each band.
-            c = cmap(0.1 + 0.8 * (wlen - min_wlen) / (max_wlen - min_wlen))
+    # Convert all response wavelengths with the same scale factor.
+    try:
+        wlen_scale = _unit_scale(default_wavelength_unit, wavelength_unit)
+    except astropy.units.UnitConversionError:
+        raise ValueError('Invalid wavelength_unit.')
+
+    if max_wlen > min_wlen:
+        # Use an approximate spectral color for each band.
+        colors = [tuple(c) for c in cmap(
+            0.1 + 0.8 * (effective_wavelengths - min_wlen) /
+            (max_wlen - min_wlen))]
+    else:
+        colors = ['green'] * len(responses)
+
+    # Draw all the bands with one collection of filled areas and one
+    # collection of lines, rather than two artists per band.
+    curves = []
+    for response in responses:
+        # No conversion is needed in the common case of the default unit.
+        if wlen_scale == 1:
+            wlen = response._wavelength
         else:
-            c = 'green'
-        wlen = response._wavelength * default_wavelength_unit
-        try:
-            wlen = wlen.to(wavelength_unit)
-        except astropy.units.UnitConversionError:
-            raise ValueError('Invalid wavelength_unit.')
-
-        plt.fill_between(wlen.value, response.response, color=c, alpha=0.25)
-        plt.plot(wlen.value, response.response,
-                 color=c, alpha=0.5, label=response.name)
+            wlen = response._wavelength * wlen_scale
+        curves.append(np.vstack((wlen, response.response)).T)
+    fills = [np.vstack(([curve[0, 0], 0.], curve, [curve[-1, 0], 0.]))
+             for curve in curves]
+    ax.add_collection(matplotlib.collections.PolyCollection(
+        fills, facecolors=colors, edgecolors=colors, alpha=0.25))
+    ax.add_collection(matplotlib.collections.LineCollection(
+        curves, colors=colors, alpha=0.5))
+    ax.autoscale_view()
 
     plt.xlabel('Wavelength [{0}]'.format(wavelength_unit))
     plt.ylabel('Filter Response')
     if legend_loc is not None:
-        plt.legend(loc = legend_loc)
+        handles = [matplotlib.lines.Line2D([], [], color=c, alpha=0.5)
+                   for c in colors]
+        plt.legend(handles, responses.names, loc = legend_loc)
     plt.grid()
 
 
@@ -1703,14 +2838,13 @@ def filter_sampling_explanatory_plot(save=None):
     c1 = rconv(flux, plot=True).cgs
     #
     wlen = np.linspace(4500, 7400, 30) * default_wavelength_unit
-    rconv = FilterConvolution('bessell-V', wlen, units=default_flux_unit)
+    rconv = rconv.with_new_wavelength(wlen, interpolate=False)
     flux = np.ones_like(wlen.value) * default_flux_unit
     plt.subplot(1, 3, 2)
     c2 = rconv(flux, plot=True).cgs
     #
     wlen = np.linspace(4500, 7400, 9) * default_wavelength_unit
-    rconv = FilterConvolution(
-        'bessell-V', wlen, interpolate=True, units=default_flux_unit)
+    rconv = rconv.with_new_wavelength(wlen, interpolate=True)
     flux = np.ones_like(wlen.value) * default_flux_unit
     plt.subplot(1, 3, 3)
     c3 = rconv(flux, plot=True).cgs
@@ -3,6 +3,16 @@ from __future__ import print_function, division
 
 from astropy.tests.helper import pytest
 from ..filters import *
+from ..filters import _fused_trapz, _trapz_weights, _hc_constant, \
+    _uniform_spacing, _uniform_trapz, _linear_interpolation_weights, \
+    _broadcast_shape, _broadcast_along, _disk_cache_name, _read_ecsv_fast, \
+    _load_filter_index, _write_filter_index
+from .. import filters
+
+import os
+import sys
+import time
+import subprocess
 
 import numpy as np
 import math
@@ -14,11 +24,71 @@ import matplotlib
 matplotlib.use('Agg') # Must be before importing matplotlib.pyplot or pylab!
 
 
+@pytest.fixture(autouse=True)
+def disk_cache_dir(tmpdir, monkeypatch):
+    # Keep the parsed filter files written by these tests out of the user's
+    # astropy cache directory.
+    cache_dir = str(tmpdir.join('cache'))
+    monkeypatch.setattr(filters, '_disk_cache_dir', lambda: cache_dir)
+    return cache_dir
+
 def test_ab_invalid_wlen():
     with pytest.raises(ValueError):
         ab_reference_flux(1 * u.s)
 
 
+def test_fused_trapz():
+    import scipy.integrate
+    x = np.array([1., 2., 4., 7.])
+    y = np.arange(24.).reshape(2, 4, 3) ** 2
+    for axis in (1, -2):
+        assert np.allclose(_fused_trapz(y, x, axis=axis),
+                           scipy.integrate.trapz(y, x, axis=axis))
+    assert np.allclose(_fused_trapz(y[0, :, 0], x),
+                       scipy.integrate.trapz(y[0, :, 0], x))
+
+
+def test_trapz_weights():
+    x = np.array([1., 2., 4., 7.])
+    y = np.arange(8.).reshape(2, 4) ** 2
+    assert np.allclose(np.dot(y, _trapz_weights(x)), _fused_trapz(y, x))
+    assert np.allclose(_trapz_weights(x[:2]), [0.5, 0.5])
+
+
+def test_uniform_trapz():
+    x = np.linspace(4000., 5000., 11)
+    assert np.allclose(_uniform_spacing(x), 100.)
+    assert _uniform_spacing(x ** 2) is None
+    y = np.arange(22.).reshape(2, 11) ** 2
+    assert np.allclose(_uniform_trapz(y, 100.), _fused_trapz(y, x))
+    assert np.allclose(_uniform_trapz(y.T, 100., axis=0), _fused_trapz(y, x))
+    r = FilterResponse(x, [0, 1, 1, 1, 2, 2, 1, 1, 0, 0, 0],
+                       dict(group_name='g', band_name='b'))
+    assert r._dx is not None
+    expected = _fused_trapz(r._photon_response * r._wavelength ** 2,
+                            r._wavelength)
+    assert np.allclose(
+        r.convolve_with_function(lambda wlen: wlen.value ** 2), expected)
+
+
+def test_linear_interpolation_weights():
+    xp = np.array([1., 2., 4., 8.])
+    x = np.array([0., 1., 1.5, 2., 3., 8., 9.])
+    idx, w = _linear_interpolation_weights(x, xp)
+    for fp in (np.array([1., 2., 3., 4.]), np.array([0., 5., -1., 2.])):
+        assert np.allclose((1 - w) * fp[idx] + w * fp[idx + 1],
+                           np.interp(x, xp, fp))
+
+
+def test_broadcast_shape():
+    assert _broadcast_shape(1, -1, 5) == (5,)
+    assert _broadcast_shape(3, 1, 5) == (1, 5, 1)
+    assert _broadcast_shape(3, -1, 5) is _broadcast_shape(3, -1, 5)
+    x = np.arange(5.)
+    assert _broadcast_along(x, 2, 1) is x
+    assert _broadcast_along(x, 2, 0).shape == (5, 1)
+
+
 def test_validate_bad_wlen():
     with pytest.raises(ValueError):
         validate_wavelength_array(1. * u.Angstrom)
@@ -35,6 +105,59 @@ def test_validate_units():
     validate_wavelength_array([1.] * u.m)
 
 
+def test_validate_no_side_effects():
+    wlen = [1., 2.] * u.nm
+    assert np.allclose(validate_wavelength_array(wlen), [10., 20.])
+    assert np.array_equal(wlen.value, [1., 2.])
+    wlen = np.array([1., 2.]) * u.Angstrom
+    assert np.may_share_memory(validate_wavelength_array(wlen), wlen)
+
+
+def test_validate_cache():
+    import gc
+    import weakref
+    from ..filters import _validated_cache
+    # Writeable inputs are never remembered, so changes are always detected.
+    wlen = np.array([1., 2., 3.]) * u.nm
+    assert np.allclose(validate_wavelength_array(wlen), [10., 20., 30.])
+    assert id(wlen) not in _validated_cache
+    wlen[1] = 4. * u.nm
+    with pytest.raises(ValueError):
+        validate_wavelength_array(wlen)
+    # Read-only inputs are remembered without keeping them alive.
+    for unit in (u.nm, None):
+        wlen = np.array([1., 2., 3.])
+        wlen.flags.writeable = False
+        if unit is not None:
+            wlen = u.Quantity(wlen, unit, copy=False)
+        assert not wlen.flags.writeable
+        validated = validate_wavelength_array(wlen)
+        assert validate_wavelength_array(wlen) is validated
+        with pytest.raises(ValueError):
+            validate_wavelength_array(wlen, min_length=4)
+        key = id(wlen)
+        assert key in _validated_cache
+        ref = weakref.ref(wlen)
+        del wlen, validated
+        gc.collect()
+        assert ref() is None
+        assert key not in _validated_cache
+    # The cache size is limited.
+    grids = [np.arange(1., 4.) + i for i in range(100)]
+    for grid in grids:
+        grid.flags.writeable = False
+        validate_wavelength_array(grid)
+    assert len(_validated_cache) <= 16
+
+
+def test_convolution_no_side_effects():
+    wlen = np.linspace(3000., 12000., 2000)
+    original = wlen.copy()
+    for band in 'gri':
+        FilterConvolution('sdss2010-' + band, wlen)
+    assert np.array_equal(wlen, original)
+
+
 def test_tabulate_wlen_units():
     with pytest.raises(ValueError):
         tabulate_function_of_wavelength(lambda wlen: 1, [1.])
@@ -74,6 +197,41 @@ def test_tabulate():
         assert np.array_equal(f4[0], g4[0]) and g4[1] == u.erg
 
 
+def test_tabulate_mode():
+    wlen = np.arange(1, 4) * u.Angstrom
+    calls = []
+    def f(wlen):
+        calls.append(wlen)
+        return math.sqrt(wlen)
+    r = FilterResponse(wlen, [0, 1, 0], dict(group_name='g', band_name='b'))
+    r1 = r.convolve_with_function(f)
+    num_calls = len(calls)
+    del calls[:]
+    r2 = r.convolve_with_function(f)
+    assert r1 == r2
+    assert len(calls) == len(r._wavelength) < num_calls
+    assert f._speclite_tabulate_mode == 'iterate_without_units'
+    # The remembered mode is shared by all filters.
+    del calls[:]
+    tabulate_function_of_wavelength(f, wlen)
+    assert len(calls) == len(wlen)
+
+
+def test_tabulate_broadcast_runtime_error():
+    wlen = np.arange(1, 4) * u.Angstrom
+    def f(wlen):
+        if not np.isscalar(getattr(wlen, 'value', wlen)):
+            raise RuntimeError('Scalars only.')
+        return 2 * wlen
+    values, units = tabulate_function_of_wavelength(f, wlen)
+    assert np.array_equal(values, 2 * wlen.value)
+    assert units == u.Angstrom
+    assert f._speclite_tabulate_mode == 'iterate_with_units'
+    # A broadcast mode that raises later falls back to the other modes.
+    f._speclite_tabulate_mode = 'broadcast_with_units'
+    values, units = tabulate_function_of_wavelength(f, wlen)
+    assert np.array_equal(values, 2 * wlen.value)
+
 def test_tabulate_not_func():
     wlen = np.arange(1, 3) * u.Angstrom
     for v in True, False:
@@ -125,6 +283,105 @@ def test_response_call():
         result = r(1. * u.erg)
 
 
+def test_response_call_scalar():
+    wlen = [1, 2, 4]
+    meta = dict(group_name='g', band_name='b')
+    r = FilterResponse(wlen, [0, 1, 0], meta)
+    x = [0., 1., 1.5, 2., 3., 3.5, 4., 5.]
+    for xi, expected in zip(x, r(x)):
+        result = r(xi)
+        assert isinstance(result, float)
+        assert result == expected
+    assert np.allclose(r(0.2 * u.nm), r(2.))
+
+
+def test_response_interpolator():
+    wlen = [1, 2, 3]
+    meta = dict(group_name='g', band_name='b')
+    r = FilterResponse(wlen, [0, 1, 0], meta)
+    x = [0., 1., 1.5, 2., 2.5, 3., 4.]
+    assert np.array_equal(r(x), r.interpolator(x))
+    assert r.interpolator is r.interpolator
+
+
+def test_response_function_cache():
+    rband = load_filter('sdss2010-r')
+    calls = []
+    def flux(wlen):
+        calls.append(1)
+        return 1e-17 * default_flux_unit
+    first = rband.convolve_with_function(flux, cache=True)
+    assert len(calls) > 0
+    num_calls = len(calls)
+    assert rband.convolve_with_function(flux, cache=True) is first
+    assert len(calls) == num_calls
+    # The cached result cannot be modified in place.
+    with pytest.raises(ValueError):
+        first *= 2
+    assert rband.convolve_with_function(flux, cache=True) is first
+    rband.convolve_with_function(flux)
+    rband.convolve_with_function(flux, photon_weighted=False, cache=True)
+    assert len(calls) > num_calls
+    rband.clear_convolution_cache()
+    num_calls = len(calls)
+    assert rband.convolve_with_function(flux, cache=True) == first
+    assert len(calls) > num_calls
+
+
+def test_response_grid_cache():
+    wlen = [1, 2, 3]
+    meta = dict(group_name='g', band_name='b')
+    r = FilterResponse(wlen, [0, 1, 0], meta)
+    grid = np.linspace(0., 4., 9)
+    r1 = r._response_on_grid(grid)
+    assert np.array_equal(r1, r(grid))
+    assert r._response_on_grid(grid.copy()) is r1
+    assert not r1.flags.writeable
+    grid[1] += 0.1
+    assert r._response_on_grid(grid) is not r1
+
+
+def test_response_convolution_cache():
+    wlen = [1, 2, 3]
+    meta = dict(group_name='g', band_name='b')
+    r = FilterResponse(wlen, [0, 1, 0], meta)
+    grid = np.linspace(0., 4., 9)
+    c1 = r._get_convolution(grid, True, False, None)
+    assert r._get_convolution(grid.copy(), True, False, None) is c1
+    assert r._get_convolution(grid, False, False, None) is not c1
+    assert r._get_convolution(grid, True, False, u.Jy) is not c1
+    assert np.allclose(r.convolve_with_array(grid, grid ** 2),
+                       FilterConvolution(r, grid)(grid ** 2))
+
+
+def test_response_table():
+    wlen = np.array([1., 2., 3.])
+    meta = dict(group_name='g', band_name='b')
+    r = FilterResponse(wlen, [0, 1, 0], meta)
+    assert r._wavelength.base is r._table and r.response.base is r._table
+    assert np.array_equal(r._photon_response, [0, 2 / _hc_constant.value, 0])
+    # The input wavelength array is not shared.
+    wlen[0] = 0.
+    assert r._wavelength[0] == 1.
+
+
+def test_response_zeropoint():
+    rband = load_filter('sdss2010-r')
+    zpt = rband.convolve_with_function(ab_reference_flux)
+    assert zpt.unit == rband.ab_zeropoint.unit
+    assert np.allclose(zpt.value, rband.ab_zeropoint.value)
+
+
+def test_response_effective_wavelength():
+    rband = load_filter('sdss2010-r')
+    one = u.Quantity(1.)
+    numer = rband.convolve_with_function(lambda wlen: wlen)
+    denom = rband.convolve_with_function(lambda wlen: one)
+    weff = numer / denom
+    assert weff.unit == rband.effective_wavelength.unit
+    assert np.allclose(weff.value, rband.effective_wavelength.value)
+
+
 def test_response_bad():
     wlen = [1, 2, 3]
     meta = dict(group_name='g', band_name='b')
@@ -234,6 +491,59 @@ def test_response_save_load(tmpdir):
     assert r1.meta == r2.meta
 
 
+def test_response_disk_cache(tmpdir, monkeypatch):
+    name = 'sdss2010-r'
+    file_name = os.path.join(
+        os.path.dirname(filters.__file__), 'data', 'filters', name + '.ecsv')
+    r1 = load_filter(name, load_from_cache=False)
+    cache_name = _disk_cache_name(file_name)
+    assert os.path.isfile(cache_name)
+    # The cached copy should be used without parsing the file again.
+    def no_read(*args, **kwargs):
+        raise RuntimeError('Unexpected read.')
+    monkeypatch.setattr(astropy.table.Table, 'read', staticmethod(no_read))
+    monkeypatch.setattr(filters, '_read_ecsv_fast', no_read)
+    r2 = load_filter(name, load_from_cache=False)
+    assert np.array_equal(r1._wavelength, r2._wavelength)
+    assert np.array_equal(r1.response, r2.response)
+    assert r1.meta == r2.meta
+    # Custom filter files are never cached.
+    meta = dict(group_name='g', band_name='b', description='test')
+    r3 = FilterResponse([1, 2, 3] * u.nm, [0, 1, 0], meta)
+    save_name = r3.save(str(tmpdir))
+    assert _disk_cache_name(save_name) is None
+    # Modifying a file invalidates its cache.
+    cache_name = str(tmpdir.join('cache', 'g-b.npy'))
+    filters._save_filter_fast(
+        save_name, cache_name, r3._wavelength * default_wavelength_unit,
+        r3.response, r3.meta)
+    r4 = filters._load_filter_fast(save_name, cache_name)
+    assert np.array_equal(r3._wavelength, r4._wavelength)
+    assert np.array_equal(r3.response, r4.response)
+    assert r3.meta == r4.meta
+    r5 = FilterResponse([1, 2, 3, 4] * u.nm, [0, 1, 1, 0], meta)
+    os.remove(save_name)
+    r5.save(str(tmpdir))
+    assert filters._load_filter_fast(save_name, cache_name) is None
+
+
+def test_read_ecsv_fast(tmpdir):
+    pytest.importorskip('pandas')
+    meta = dict(group_name='g', band_name='b', description='a "quoted"\nvalue')
+    table = astropy.table.Table(meta=meta)
+    table['wavelength'] = astropy.table.Column([1., 2., 3.], unit='nm')
+    table['response'] = astropy.table.Column([0, 0.1, 0])
+    save_name = str(tmpdir.join('g-b.ecsv'))
+    table.write(save_name, format='ascii.ecsv')
+    t1 = _read_ecsv_fast(save_name)
+    t2 = astropy.table.Table.read(save_name, format='ascii.ecsv', guess=False)
+    assert t1.colnames == t2.colnames
+    assert dict(t1.meta) == dict(t2.meta)
+    for name in t2.colnames:
+        assert t1[name].unit == t2[name].unit
+        assert np.array_equal(t1[name].data, t2[name].data)
+
+
 def test_convolution_ctor():
     FilterConvolution('sdss2010-r', [4000., 8000.], interpolate=True)
     rband = load_filter('sdss2010-r')
@@ -265,6 +575,117 @@ def test_convolution_call():
         conv([[1, 1], [1, 1]] * u.m)
 
 
+def test_convolution_single_precision():
+    wlen = np.linspace(4000., 8000., 10)
+    conv = FilterConvolution('sdss2010-r', wlen, interpolate=True)
+    flux = np.ones((3, len(wlen)))
+    c64 = conv(flux)
+    c32 = conv(flux.astype(np.float32))
+    assert c64.dtype == np.float64 and c32.dtype == np.float32
+    assert np.allclose(c32, c64, rtol=1e-5, atol=0)
+    rband = load_filter('sdss2010-r')
+    m32 = rband.get_ab_magnitude(flux.astype(np.float32), wlen)
+    assert m32.dtype == np.float64
+    assert np.allclose(m32, rband.get_ab_magnitude(flux, wlen), atol=1e-5)
+
+
+def test_convolution_interpolate_axis():
+    wlen = np.linspace(4000., 8000., 10)
+    conv = FilterConvolution('sdss2010-r', wlen, interpolate=True)
+    flux = np.vstack([wlen, wlen ** 2, np.sqrt(wlen)])
+    results = conv(flux)
+    assert np.allclose(conv(flux.T, axis=0), results)
+    for i in range(len(flux)):
+        # Interpolating a linear function gives the same integrand as
+        # convolving the response with the function itself.
+        assert np.allclose(results[i], conv(flux[i]))
+    response = conv.response
+    expected = response.convolve_with_function(lambda wlen: wlen.value)
+    assert np.allclose(results[0], expected, rtol=1e-3)
+
+
+def test_convolution_merge():
+    meta = dict(group_name='g', band_name='b')
+    r = FilterResponse([1., 2., 2.5, 3., 3.5, 5., 6.], [0, 1, 2, 3, 2, 1, 0],
+                       meta)
+    conv = FilterConvolution(r, [1., 3., 6.], interpolate=True)
+    combined = np.hstack([conv._wavelength, conv.interpolate_wavelength])
+    assert np.array_equal(conv.quad_wavelength, np.sort(combined))
+    assert np.array_equal(
+        combined[conv.interpolate_sort_order], conv.quad_wavelength)
+
+
+def test_convolution_trap_weight():
+    wlen = np.linspace(4000., 8000., 1000)
+    conv = FilterConvolution('sdss2010-r', wlen)
+    flux = np.vstack([np.ones_like(wlen), wlen])
+    s = conv.response_slice
+    expected = _fused_trapz(
+        flux[:, s] * conv.response_grid * conv.quad_weight,
+        conv.quad_wavelength)
+    assert np.allclose(conv(flux), expected)
+    assert np.allclose(conv(flux.T, axis=0), expected)
+
+
+def test_convolution_with_new_wavelength():
+    rband = load_filter('sdss2010-r')
+    conv1 = FilterConvolution(rband, [5000., 8000.], interpolate=True,
+                              photon_weighted=False, units=default_flux_unit)
+    wlen = np.linspace(5000, 8000, 500)
+    conv2 = conv1.with_new_wavelength(wlen)
+    assert conv2.response is rband
+    assert conv2.num_wavelength == len(wlen)
+    assert conv2.input_units == default_flux_unit
+    expected = FilterConvolution(rband, wlen, interpolate=True,
+                                 photon_weighted=False, units=default_flux_unit)
+    flux = np.ones_like(wlen)
+    assert np.allclose(conv2(flux), expected(flux))
+    with pytest.raises(ValueError):
+        conv1.with_new_wavelength(wlen[::50], interpolate=False)
+
+
+def test_convolution_dtype():
+    wlen = np.linspace(4000., 8000., 10)
+    flux = np.ones((3, len(wlen)))
+    c64 = FilterConvolution('sdss2010-r', wlen, interpolate=True)
+    c32 = FilterConvolution('sdss2010-r', wlen, interpolate=True,
+                            units=default_flux_unit, dtype=np.float32)
+    assert c32.dtype == np.float32
+    result = c32(flux)
+    assert result.dtype == np.float32
+    assert np.allclose(result, c64(flux), rtol=1e-5, atol=0)
+    assert c32(flux * default_flux_unit).value.dtype == np.float32
+    c = FilterConvolution('sdss2010-r', wlen, interpolate=True, dtype=float)
+    assert c(flux.astype(np.float32)).dtype == np.float64
+    with pytest.raises(ValueError):
+        FilterConvolution('sdss2010-r', wlen, interpolate=True, dtype=int)
+
+
+def test_convolution_sparse():
+    wlen = np.linspace(4000., 8000., 1000)
+    conv = FilterConvolution('sdss2010-r', wlen, interpolate=True)
+    flux = np.zeros((2, len(wlen)))
+    flux[0, 400:410] = 1.
+    flux[1, 500:520] = 2.
+    expected = conv(flux)
+    assert np.allclose(conv(flux, sparse=True), expected)
+    assert np.allclose(conv(flux.T, axis=0, sparse=True), expected)
+    assert np.allclose(conv(flux[0], sparse=True), expected[0])
+    assert conv(np.zeros_like(wlen), sparse=True) == 0
+
+
+def test_convolution_units_no_side_effects():
+    wlen = np.linspace(4000., 8000., 1000)
+    conv = FilterConvolution('sdss2010-r', wlen, units=default_flux_unit)
+    flux = np.ones((2, len(wlen))) * default_flux_unit
+    expected = conv(flux)
+    flux_si = flux.to(default_flux_unit * u.erg / u.J)
+    original = flux_si.copy()
+    assert np.allclose(conv(flux_si).value, expected.value)
+    assert np.array_equal(flux_si, original)
+    assert np.allclose(conv(flux_si).value, expected.value)
+
+
 def test_convolution_call_no_units():
     conv = FilterConvolution('sdss2010-r', [4000., 8000.],
                              interpolate=True, units=None)
@@ -288,6 +709,78 @@ def test_load_filter():
         load_filter('none.dat')
 
 
+def test_load_filter_threads():
+    import threading
+    from ..filters import _filter_cache
+    _filter_cache.pop('sdss2010-u', None)
+    loaded = []
+    threads = [threading.Thread(
+        target=lambda: loaded.append(load_filter('sdss2010-u')))
+        for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(loaded) == 4
+    assert all(response is loaded[0] for response in loaded)
+
+
+def test_load_filters_threads():
+    from ..filters import _filter_cache
+    names = ['decam2014-{0}'.format(band) for band in 'ugrizY']
+    for name in names:
+        _filter_cache.pop(name, None)
+    s = load_filters('decam2014-*')
+    assert sorted(s.names) == sorted(names)
+    for r in s:
+        assert load_filter(r.name) is r
+
+
+def test_load_filters_threads_custom(tmpdir, monkeypatch):
+    file_names = []
+    for band in 'abcde':
+        meta = dict(group_name='custom', band_name=band)
+        r = FilterResponse([1, 2, 3] * u.nm, [0, 1, 0], meta)
+        file_names.append(r.save(str(tmpdir)))
+    loads = []
+    load_filter_file = filters._load_filter_file
+    def counting_load(name, verbose):
+        loads.append(name)
+        return load_filter_file(name, verbose)
+    monkeypatch.setattr(filters, '_load_filter_file', counting_load)
+    s = load_filters(*file_names)
+    assert sorted(loads) == sorted(file_names)
+    assert s.names == ['custom-{0}'.format(band) for band in 'abcde']
+    # Each distinct name is only loaded once, even when repeated.
+    del loads[:]
+    load_filters(*(file_names + file_names[:2]))
+    assert sorted(loads) == sorted(file_names)
+
+
+def test_load_filters_during_import(tmpdir):
+    # Loading filters at import time must not deadlock on the python 2
+    # global import lock held by the importing thread.
+    tmpdir.join('load_during_import.py').write(
+        'import speclite.filters\n'
+        'speclite.filters._disk_cache_dir = lambda: {0!r}\n'
+        'bands = speclite.filters.load_filters("decam2014-*")\n'
+        .format(str(tmpdir.join('cache'))))
+    package_path = os.path.dirname(os.path.dirname(filters.__file__))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [package_path] + sys.path + [str(tmpdir)])
+    process = subprocess.Popen(
+        [sys.executable, '-c', 'import load_during_import'],
+        cwd=str(tmpdir), env=env)
+    timeout = time.time() + 60
+    while process.poll() is None and time.time() < timeout:
+        time.sleep(0.1)
+    if process.poll() is None:
+        process.kill()
+        process.wait()
+        pytest.fail('load_filters did not return during an import.')
+    assert process.returncode == 0
+
 def test_load_bad(tmpdir):
     meta = dict(group_name='g', band_name='b')
     # Missing wavelength column.
@@ -327,6 +820,7 @@ def test_response_sequence():
     r = s[0]
     assert r in s
     assert s.names == [r.name]
+    assert s.effective_wavelengths[0] == r.effective_wavelength
 
 
 def test_response_sequence_calls():
@@ -338,11 +832,117 @@ def test_response_sequence_calls():
     s.get_ab_magnitudes(flux, wlen)
 
 
+def test_response_sequence_units():
+    s = load_filters('sdss2010-*')
+    wlen = np.linspace(2000, 12000, 500)
+    flux = np.ones((3, len(wlen))) * 1e-17
+    t = s.get_ab_maggies(flux * default_flux_unit, wlen * u.Angstrom)
+    flux_units = default_flux_unit * u.erg / u.J
+    flux_si = (flux * default_flux_unit).to(flux_units)
+    t_si = s.get_ab_maggies(flux_si, (wlen * u.Angstrom).to(u.nm))
+    assert flux_si.unit == flux_units
+    for r in s:
+        expected = r.get_ab_maggies(flux, wlen)
+        assert np.allclose(t[r.name], expected)
+        assert np.allclose(t_si[r.name], expected)
+    with pytest.raises(ValueError):
+        s.get_ab_maggies(flux * u.erg, wlen)
+
+
+def test_response_sequence_batched():
+    s = load_filters('sdss2010-*')
+    wlen = np.linspace(2000, 12000, 50)
+    flux = np.vstack([np.ones_like(wlen), wlen, 1e4 / wlen]) * 1e-17
+    t = s.get_ab_maggies(flux, wlen)
+    tT = s.get_ab_maggies(flux.T, wlen, axis=0)
+    m = s.get_ab_magnitudes(flux, wlen)
+    for r in s:
+        assert np.allclose(t[r.name], r.get_ab_maggies(flux, wlen))
+        assert np.allclose(tT[r.name], t[r.name])
+        assert np.allclose(m[r.name], r.get_ab_magnitude(flux, wlen))
+    # Values outside of a filter's wavelength range do not contribute,
+    # even when they are not finite.
+    flux[:, -1] = np.nan
+    t = s.get_ab_maggies(flux, wlen)
+    for r in s:
+        assert np.allclose(t[r.name], r.get_ab_maggies(flux, wlen))
+    with pytest.raises(ValueError):
+        s.get_ab_maggies(flux[:, 1:], wlen)
+
+
+def test_response_sequence_function():
+    s = load_filters('sdss2010-*', 'wise2010-W1')
+    functions = (
+        ab_reference_flux,
+        lambda wlen: 1e-17 * default_flux_unit,
+        lambda wlen: 1e-17 * np.asarray(wlen) / 5000.,
+        )
+    for function in functions:
+        t = s.get_ab_maggies(function)
+        m = s.get_ab_magnitudes(function)
+        for r in s:
+            assert np.allclose(t[r.name], r.get_ab_maggies(function),
+                               rtol=1e-12, atol=0)
+            assert np.allclose(m[r.name], r.get_ab_magnitude(function))
+    # Values outside of a filter's wavelength range do not contribute,
+    # even when they are not finite.
+    def nan_function(wlen):
+        return np.where(wlen < 20000, 1e-17, np.nan)
+    t = s.get_ab_maggies(nan_function)
+    for r in s[:-1]:
+        assert np.allclose(t[r.name], r.get_ab_maggies(nan_function))
+    with pytest.raises(ValueError):
+        s.get_ab_maggies(lambda wlen: 1 * u.m)
+
+
+def test_response_sequence_compile():
+    s = load_filters('sdss2010-*')
+    wlen = np.linspace(2000, 12000, 50)
+    flux = np.vstack([np.ones_like(wlen), wlen, 1e4 / wlen]) * 1e-17
+    t = s.get_ab_maggies(flux, wlen)
+    maggies = s.compile_for(wlen)(flux)
+    maggies32 = s.compile_for(wlen, dtype=np.float32)(
+        flux.astype(np.float32))
+    assert maggies32.dtype == np.float32
+    for i, name in enumerate(s.names):
+        assert np.allclose(maggies[:, i], t[name])
+        assert np.allclose(maggies32[:, i], t[name], rtol=1e-5, atol=0)
+    assert np.allclose(s.compile_for(wlen)(flux[0]), maggies[0])
+    # Single-precision weights are cached along with the double-precision
+    # ones, instead of being converted on every call.
+    t32 = s.get_ab_maggies(flux.astype(np.float32), wlen)
+    for name in s.names:
+        assert np.allclose(t32[name], t[name], rtol=1e-5, atol=0)
+    weights32 = s._get_maggies_weights(wlen, np.float32)
+    assert weights32.dtype == np.float32 and not weights32.flags.writeable
+    assert s._get_maggies_weights(wlen, np.float32) is weights32
+
+
 def test_load_filters():
     load_filters('sdss2010-*')
     load_filters('sdss2010-r', 'wise2010-W4')
 
 
+def test_filter_index(tmpdir):
+    # The index of standard filters must be up to date.
+    filters_path = os.path.join(os.path.dirname(filters.__file__),
+                                'data', 'filters')
+    index = _load_filter_index(filters_path)
+    names = [os.path.splitext(name)[0] for name in os.listdir(filters_path)
+             if name.endswith('.ecsv')]
+    assert sorted(index.keys()) == sorted(names)
+    for name in names:
+        assert np.allclose(load_filter(name).effective_wavelength.value,
+                           index[name], rtol=1e-12, atol=0)
+    # Write and read back the index of a custom directory.
+    meta = dict(group_name='g', band_name='b')
+    r = FilterResponse([1, 2, 3] * u.nm, [0, 1, 0], meta)
+    r.save(str(tmpdir))
+    _write_filter_index(str(tmpdir))
+    assert np.allclose(_load_filter_index(str(tmpdir))['g-b'],
+                       r.effective_wavelength.value)
+
+
 def test_plot_filters():
     plot_filters(load_filters('sdss2010-r'))
     plot_filters(load_filters('sdss2010-g', 'sdss2010-r'))